@@ -4,17 +4,18 @@ import os
 
 class Scene1(ice.Scene):
     def __init__(self):
+        # The logo and its backdrop never change, only the offset does.
+        self._logo = ice.Image(os.path.join("images", "logo.png"))
+        self._blank = ice.Blank(self._logo.bounds, ice.Colors.TRANSPARENT)
+
         super().__init__(duration=1.0, make_frame=self.make_frame)
 
     def make_frame(self, t: float) -> ice.Drawable:
         progress = t / self.duration
 
-        logo = ice.Image(os.path.join("images", "logo.png"))
-        blank = ice.Blank(logo.bounds, ice.Colors.TRANSPARENT)
-
         dy = ice.tween(-10, 10, progress)
 
-        scene = ice.Anchor([blank, logo.move(0, dy)])
+        scene = ice.Anchor([self._blank, self._logo.move(0, dy)])
 
         return scene
 
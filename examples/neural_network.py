@@ -1,12 +1,10 @@
 from typing import Tuple, Sequence, Union
 
 from absl import app
-from absl import flags
+import numpy as np
 
 import iceberg as ice
 
-FLAGS = flags.FLAGS
-
 
 class NeuralNetwork(ice.DrawableWithChild):
     layer_node_counts: Tuple[int, ...]
@@ -59,27 +57,77 @@ class NeuralNetwork(ice.DrawableWithChild):
             gap=self._layer_gap,
         )
 
-        # Draw the lines.
-        self._lines = []
-        for layer_a, layer_b in zip(self.layer_nodes[:-1], self.layer_nodes[1:]):
-            for circle_a in layer_a:
-                for circle_b in layer_b:
-                    start = nodes_arranged.child_bounds(circle_a).corners[
-                        ice.Corner.MIDDLE_RIGHT
-                    ]
-                    end = nodes_arranged.child_bounds(circle_b).corners[
-                        ice.Corner.MIDDLE_LEFT
-                    ]
-
-                    line = ice.Line(start, end, self._line_path_style)
-                    self._lines.append(line)
+        # Draw the lines. Lines connect the sides of the nodes, which are read
+        # from flat per-node arrays, and the all-pairs endpoints between adjacent
+        # layers are built with NumPy.
+        centers, radii, layer_offsets = self._node_soa(nodes_arranged)
+        rights = centers + np.stack([radii, np.zeros_like(radii)], axis=1)
+        lefts = centers - np.stack([radii, np.zeros_like(radii)], axis=1)
+
+        layer_starts = [np.empty((0, 2))]
+        layer_ends = [np.empty((0, 2))]
+        for a_start, b_start, b_end in zip(
+            layer_offsets[:-2], layer_offsets[1:-1], layer_offsets[2:]
+        ):
+            rights_a = rights[a_start:b_start]
+            lefts_b = lefts[b_start:b_end]
+
+            edge_count = (len(rights_a), len(lefts_b), 2)
+            layer_starts.append(
+                np.broadcast_to(rights_a[:, None, :], edge_count).reshape(-1, 2)
+            )
+            layer_ends.append(
+                np.broadcast_to(lefts_b[None, :, :], edge_count).reshape(-1, 2)
+            )
+
+        # All the edges are drawn as a single batched path.
+        self._lines = ice.LineBatch(
+            np.concatenate(layer_starts),
+            np.concatenate(layer_ends),
+            self._line_path_style,
+        )
 
         # All the children in this composition.
         # Nodes are drawn on top of lines.
-        children = self._lines
-        children.append(nodes_arranged)
+        self.set_child(ice.Compose([self._lines, nodes_arranged]))
+
+    def _node_soa(
+        self, nodes_arranged: ice.Drawable
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Flatten the arranged nodes into contiguous arrays.
+
+        Args:
+            nodes_arranged: The arrangement containing all the nodes.
+
+        Returns:
+            The node centers as a (total_nodes, 2) array, the horizontal node radii
+            (including the border) as a (total_nodes,) array, and the offsets of
+            each layer into those arrays, with a trailing total.
+        """
+
+        nodes = [node for layer in self.layer_nodes for node in layer]
 
-        self.set_child(ice.Compose(children))
+        centers = nodes_arranged.children_corners(nodes, ice.Corner.CENTER)
+        rights = nodes_arranged.children_corners(nodes, ice.Corner.MIDDLE_RIGHT)
+        radii = rights[:, 0] - centers[:, 0]
+        layer_offsets = np.cumsum([0] + [len(layer) for layer in self.layer_nodes])
+
+        return centers, radii, layer_offsets
+
+    def update_layout(self, layer_gap: float, node_vertical_gap: float):
+        """Re-layout the network with new gaps, reusing the existing nodes.
+
+        Args:
+            layer_gap: The horizontal gap between layers.
+            node_vertical_gap: The vertical gap between nodes in a layer.
+        """
+
+        self.layer_gap = layer_gap
+        self.node_vertical_gap = node_vertical_gap
+        self._layer_gap = layer_gap
+        self._node_vertical_gap = node_vertical_gap
+
+        self._initialize_based_on_nodes()
 
     @property
     def layer_nodes(self) -> Sequence[Sequence[Union[ice.Drawable, ice.Ellipse]]]:
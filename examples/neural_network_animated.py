@@ -1,32 +1,43 @@
 import iceberg as ice
+import numpy as np
 from neural_network import NeuralNetwork
 
 
 class Scene1(ice.Scene):
     def __init__(self):
-        super().__init__(duration=1.0, make_frame=self.make_frame)
+        self._canvas = ice.Blank(
+            ice.Bounds(size=(1080, 720)), background_color=ice.Colors.WHITE
+        )
+        self._line_path_style = ice.PathStyle(ice.Colors.BLACK, thickness=3)
 
-    def make_frame(self, t: float) -> ice.Drawable:
-        progress = t / self.duration
-        layer_gap = ice.tween(50, 200, progress)
-        node_vertical_gap = ice.tween(20, 50, progress)
+        # (layer_gap, node_vertical_gap) at the start and end of the scene.
+        self._start_gaps = np.array([50.0, 20.0])
+        self._end_gaps = np.array([200.0, 50.0])
 
-        network = NeuralNetwork(
+        # The nodes never change, so build the network once and only re-layout
+        # it per frame.
+        self._network = NeuralNetwork(
             layer_node_counts=[3, 4, 4, 2],
             node_border_color=ice.Colors.BLACK,
-            line_path_style=ice.PathStyle(ice.Colors.BLACK, thickness=3),
-            layer_gap=layer_gap,
-            node_vertical_gap=node_vertical_gap,
+            line_path_style=self._line_path_style,
         )
-        node = network.layer_nodes[1][0]
+        node = self._network.layer_nodes[1][0]
         node.border_color = ice.Colors.RED
         node.border_thickness = 5
         node.setup()
 
-        canvas = ice.Blank(
-            ice.Bounds(size=(1080, 720)), background_color=ice.Colors.WHITE
+        super().__init__(duration=1.0, make_frame=self.make_frame)
+
+    def make_frame(self, t: float) -> ice.Drawable:
+        progress = t / self.duration
+        # Both gaps share the same easing, so tween them together.
+        layer_gap, node_vertical_gap = ice.tween(
+            self._start_gaps, self._end_gaps, progress
         )
-        scene = canvas.add_centered(network)
+
+        self._network.update_layout(layer_gap, node_vertical_gap)
+
+        scene = self._canvas.add_centered(self._network)
 
         return scene
 
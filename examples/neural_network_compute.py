@@ -4,11 +4,19 @@
 from typing import Tuple, Sequence, Union
 
 from absl import app
-from absl import flags
+import numpy as np
 
 import iceberg as ice
 
-FLAGS = flags.FLAGS
+_GREY = ice.Color.from_hex("#151e25")
+_LIGHT_GREY = ice.Color.from_hex("#585f63")
+_LINE_GREY = ice.Color.from_hex("#2c3134")
+_LASER_COLOR = ice.Color.from_hex("#959fcc")
+_BACKGROUND_COLOR = ice.Color.from_hex("#0d1117")
+
+# Shared by every scene of the playbook, so all lines use the same Skia paints.
+_LINE_STYLE = ice.PathStyle.get(_LINE_GREY, thickness=3)
+_LASER_STYLE = ice.PathStyle.get(_LASER_COLOR, thickness=3)
 
 
 class NeuralNetwork(ice.DrawableWithChild):
@@ -22,25 +30,19 @@ class NeuralNetwork(ice.DrawableWithChild):
     line_path_style: ice.PathStyle = ice.PathStyle(ice.Colors.WHITE, thickness=3)
 
     def setup(self):
-        # [layer_index, node_index]
-        self._layer_nodes = [
-            [
-                ice.Rectangle(
-                    ice.Bounds(
-                        top=0,
-                        left=0,
-                        bottom=self.node_radius * 2,
-                        right=self.node_radius * 2,
-                    ),
-                    self.node_border_color,
-                    self.node_fill_color,
-                    self.node_border_thickness,
-                    border_radius=20,
-                )
-                for _ in range(layer_node_count)
-            ]
-            for layer_node_count in self.layer_node_counts
-        ]
+        # Every node looks the same, so one is built and moved into place per slot.
+        self._node = ice.Rectangle(
+            ice.Bounds(
+                top=0,
+                left=0,
+                bottom=self.node_radius * 2,
+                right=self.node_radius * 2,
+            ),
+            self.node_border_color,
+            self.node_fill_color,
+            self.node_border_thickness,
+            border_radius=20,
+        )
 
         self._node_vertical_gap = self.node_vertical_gap
         self._layer_gap = self.layer_gap
@@ -48,49 +50,95 @@ class NeuralNetwork(ice.DrawableWithChild):
 
         self._initialize_based_on_nodes()
 
-    def _initialize_based_on_nodes(self):
-        # Arrange the circles.
-        nodes_arranged = ice.Arrange(
-            [
-                ice.Arrange(
-                    circles,
-                    arrange_direction=ice.Arrange.Direction.VERTICAL,
-                    gap=self._node_vertical_gap,
-                )
-                for circles in self.layer_nodes
-            ],
-            arrange_direction=ice.Arrange.Direction.HORIZONTAL,
-            gap=self._layer_gap,
+    def _layout_nodes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Computes where every node goes, like arranging the layers would.
+
+        Nodes are stacked top to bottom within a layer, and layers are placed left to
+        right, vertically centered on the first layer.
+
+        Returns:
+            The (N, 2) top left corners of all the nodes, layer by layer, and the
+            offsets of every layer into them.
+        """
+
+        bounds = self._node.bounds
+        counts = np.array(self.layer_node_counts)
+        layer_offsets = np.cumsum([0, *counts])
+
+        layer_heights = counts * bounds.height + (counts - 1) * self._node_vertical_gap
+        layer_tops = bounds.top + (layer_heights[0] - layer_heights) / 2
+        layer_lefts = bounds.left + np.arange(len(counts)) * (
+            bounds.width + self._layer_gap
         )
 
-        # Draw the lines.
-        self._lines = []
+        layer_indices = np.repeat(np.arange(len(counts)), counts)
+        node_indices = np.arange(layer_offsets[-1]) - layer_offsets[layer_indices]
 
-        self._layer_lines = []
+        xs = layer_lefts[layer_indices]
+        ys = layer_tops[layer_indices] + node_indices * (
+            bounds.height + self._node_vertical_gap
+        )
 
-        for layer_a, layer_b in zip(self.layer_nodes[:-1], self.layer_nodes[1:]):
-            self._layer_lines.append([])
+        return np.stack([xs, ys], axis=1), layer_offsets
 
-            for circle_b in layer_b:
-                self._layer_lines[-1].append([])
-                for circle_a in layer_a:
-                    start = nodes_arranged.child_bounds(circle_a).corners[
-                        ice.Corner.MIDDLE_RIGHT
-                    ]
-                    end = nodes_arranged.child_bounds(circle_b).corners[
-                        ice.Corner.MIDDLE_LEFT
-                    ]
+    def _initialize_based_on_nodes(self):
+        # Place the nodes directly in one flat composition, their positions are simple
+        # enough to not need nested arranges.
+        top_lefts, layer_offsets = self._layout_nodes()
+        bounds = self._node.bounds
+
+        nodes = [
+            self._node.move(x - bounds.left, y - bounds.top)
+            for x, y in top_lefts.tolist()
+        ]
 
-                    line = ice.Line(start, end, self._line_path_style)
-                    self._lines.append(line)
-                    self._layer_lines[-1][-1].append(line)
+        # [layer_index, node_index]
+        self._layer_nodes = [
+            nodes[start:end]
+            for start, end in zip(layer_offsets[:-1], layer_offsets[1:])
+        ]
 
-        # All the children in this composition.
-        # Nodes are drawn on top of lines.
-        children = self._lines.copy()
-        children.append(nodes_arranged)
+        # Edges go from the middle of the right side to the middle of the left side.
+        lefts = top_lefts + [0, bounds.height / 2]
+        rights = lefts + [bounds.width, 0]
 
-        self.set_child(ice.Compose(children))
+        # Keep the endpoints of every edge for animating, but draw them all as one path.
+        # [layer_index, node_b, node_a] -> (start, end)
+        self._layer_lines = []
+        starts = [np.empty((0, 2))]
+        ends = [np.empty((0, 2))]
+
+        for layer_i in range(len(self.layer_nodes) - 1):
+            layer_starts = rights[layer_offsets[layer_i] : layer_offsets[layer_i + 1]]
+            layer_ends = lefts[layer_offsets[layer_i + 1] : layer_offsets[layer_i + 2]]
+
+            # [node_b, node_a]
+            edge_starts = np.broadcast_to(
+                layer_starts[None, :, :], (len(layer_ends), *layer_starts.shape)
+            )
+            edge_ends = np.broadcast_to(
+                layer_ends[:, None, :], (len(layer_ends), *layer_starts.shape)
+            )
+            starts.append(edge_starts.reshape(-1, 2))
+            ends.append(edge_ends.reshape(-1, 2))
+
+            lines = [
+                (tuple(start), tuple(end))
+                for start, end in zip(starts[-1].tolist(), ends[-1].tolist())
+            ]
+            self._layer_lines.append(
+                [
+                    lines[node_b * len(layer_starts) : (node_b + 1) * len(layer_starts)]
+                    for node_b in range(len(layer_ends))
+                ]
+            )
+
+        self._lines = ice.LineBatch(
+            np.concatenate(starts), np.concatenate(ends), self._line_path_style
+        )
+
+        # Nodes are drawn on top of lines.
+        self.set_child(ice.Compose([self._lines, *nodes]))
 
     @property
     def layer_nodes(self) -> Sequence[Sequence[Union[ice.Drawable, ice.Ellipse]]]:
@@ -99,14 +147,7 @@ class NeuralNetwork(ice.DrawableWithChild):
 
 class Play(ice.Playbook):
     def timeline(self):
-        _GREY = ice.Color.from_hex("#151e25")
-        _LIGHT_GREY = ice.Color.from_hex("#585f63")
-        _LINE_GREY = ice.Color.from_hex("#2c3134")
-        _LASER_COLOR = ice.Color.from_hex("#959fcc")
-
-        background = ice.Blank(
-            ice.Bounds(size=(1920, 1080)), ice.Color.from_hex("#0d1117")
-        )
+        background = ice.Blank(ice.Bounds(size=(1920, 1080)), _BACKGROUND_COLOR)
         network = NeuralNetwork(
             layer_node_counts=(3, 4, 4, 3),
             node_radius=70,
@@ -115,10 +156,20 @@ class Play(ice.Playbook):
             node_fill_color=_GREY,
             node_border_color=_LIGHT_GREY,
             node_border_thickness=5,
-            line_path_style=ice.PathStyle(_LINE_GREY, thickness=3),
+            line_path_style=_LINE_STYLE,
         )
 
+        # The lasers look the same in both phases, only the animated range changes.
         for layer in network._layer_lines:
+            lasers = [
+                (
+                    ice.Line(start, end, _LASER_STYLE),
+                    0.1 * node_index + 0.2 * line_index,
+                )
+                for node_index, node in enumerate(layer)
+                for line_index, (start, end) in enumerate(node)
+            ]
+
             for phase in range(2):
                 if phase == 0:
                     starts = (0, 0)
@@ -127,39 +178,34 @@ class Play(ice.Playbook):
                     starts = (0, 1)
                     ends = (1, 1)
 
-                animated_lasers = []
-                for node_index, node in enumerate(layer):
-                    for line_index, line in enumerate(node):
-                        laser = ice.Line(
-                            line.start,
-                            line.end,
-                            ice.PathStyle(_LASER_COLOR, thickness=3),
-                        )
-                        laser_animated = ice.Animated(
-                            [
-                                ice.PartialPath(
-                                    laser,
-                                    *starts,
-                                    interpolation=ice.PartialPath.Interpolation.LINEAR
-                                ),
-                                ice.PartialPath(
-                                    laser,
-                                    *ends,
-                                    interpolation=ice.PartialPath.Interpolation.LINEAR
-                                ),
-                            ],
-                            0.5,
-                            start_time=0.1 * node_index + 0.2 * line_index,
-                            ease_types=ice.EaseType.EASE_OUT_CUBIC,
-                        )
-                        animated_lasers.append(laser_animated)
+                animated_lasers = [
+                    ice.Animated(
+                        [
+                            ice.PartialPath(
+                                laser,
+                                *starts,
+                                interpolation=ice.PartialPath.Interpolation.LINEAR
+                            ),
+                            ice.PartialPath(
+                                laser,
+                                *ends,
+                                interpolation=ice.PartialPath.Interpolation.LINEAR
+                            ),
+                        ],
+                        0.5,
+                        start_time=start_time,
+                        ease_types=ice.EaseType.EASE_OUT_CUBIC,
+                    )
+                    for laser, start_time in lasers
+                ]
                 animated_network = ice.Compose([network, *animated_lasers])
                 scene = background.add_centered(animated_network).scale(0.5)
                 self.play(scene)
 
 
 def main(argv):
-    Play().combined_scene.render("test.gif")
+    # Pass e.g. `num_workers=-1` to rasterize the frames on every CPU.
+    Play().render("test.gif")
 
 
 if __name__ == "__main__":
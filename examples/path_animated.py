@@ -75,9 +75,11 @@ class Play(ice.Playbook):
             ],
             0.3,
         )
-        scene = ice.Anchor(
-            [blank, frozen_line, ice.Frozen(child=container), animated_line]
+        # Everything but the new line is static now, so draw it from a recording.
+        background = ice.Cached(
+            child=ice.Anchor([blank, frozen_line, ice.Frozen(child=container)])
         )
+        scene = ice.Anchor([background, animated_line])
         self.play(scene)
 
 
@@ -3,32 +3,31 @@ import iceberg as ice
 
 class Scene1(ice.Scene):
     def __init__(self):
+        _SIZE = 500
+        _DISPLACEMENT = 600
+
+        # Build the static backdrop once. The rectangle is computed directly from the
+        # progress every frame, instead of tweening between two rectangles.
+        self._blank = ice.Blank(ice.Bounds(size=(1920, 1080)), ice.Colors.WHITE)
+
+        self._rect_bounds = ice.Bounds(size=(_SIZE, _SIZE))
+        self._y = self._blank.rectangle.height / 2 - _SIZE / 2
+        self._start_x = self._blank.rectangle.width / 2 - _SIZE / 2 - _DISPLACEMENT
+        self._end_x = self._blank.rectangle.width / 2 - _SIZE / 2 + _DISPLACEMENT
+
         super().__init__(duration=1.0, make_frame=self.make_frame)
 
     def make_frame(self, t: float) -> ice.Drawable:
-        blank = ice.Blank(ice.Bounds(size=(1920, 1080)), ice.Colors.WHITE)
+        progress = ice.EaseType.EASE_IN_OUT_QUAD(t / self.duration)
 
-        _SIZE = 500
-        _DISPLACEMENT = 600
-        y = blank.rectangle.height / 2 - _SIZE / 2
-        start_x = blank.rectangle.width / 2 - _SIZE / 2 - _DISPLACEMENT
-        end_x = blank.rectangle.width / 2 - _SIZE / 2 + _DISPLACEMENT
-
-        rect = ice.tween(
-            ice.Rectangle(
-                ice.Bounds(size=(_SIZE, _SIZE)),
-                fill_color=ice.Colors.BLUE,
-                border_radius=0,
-            ).move(start_x, y),
-            ice.Rectangle(
-                ice.Bounds(size=(_SIZE, _SIZE)),
-                fill_color=ice.Colors.RED,
-                border_radius=1000,
-            ).move(end_x, y),
-            t / self.duration,
-        )
-
-        return ice.Compose([blank, rect])
+        x = self._start_x + (self._end_x - self._start_x) * progress
+        rect = ice.Rectangle(
+            self._rect_bounds,
+            fill_color=ice.Color.interpolate(ice.Colors.BLUE, ice.Colors.RED, progress),
+            border_radius=1000 * progress,
+        ).move(x, self._y)
+
+        return ice.Compose([self._blank, rect])
 
 
 if __name__ == "__main__":
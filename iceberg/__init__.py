@@ -21,6 +21,7 @@ from iceberg.primitives import (
     Rectangle,
     Ellipse,
     Line,
+    LineBatch,
     BorderPosition,
     Path,
     CurvedCubicLine,
@@ -46,6 +47,7 @@ from iceberg.primitives import (
     MathTypst,
     Blur,
     Opacity,
+    Cached,
     Image,
     SmoothPath,
     Point,
@@ -69,8 +71,23 @@ from iceberg.arrows import (
     ArrowPath,
 )
 
-from iceberg.animation import tween, EaseType
-from iceberg.animation.scene import Playbook, Animated, Scene, Frozen
+from iceberg.animation import tween, EaseType, ease_batch
+
+# The scene module pulls in the video and image encoders (av, PIL, tqdm), which most
+# static diagrams never need. Its classes are imported on first use (PEP 562).
+_LAZY_SCENE_ATTRIBUTES = ("Playbook", "Animated", "Scene", "Frozen")
+
+
+def __getattr__(name):
+    if name in _LAZY_SCENE_ATTRIBUTES:
+        from iceberg.animation import scene
+
+        value = getattr(scene, name)
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "Drawable",
@@ -90,6 +107,7 @@ __all__ = [
     "Rectangle",
     "Ellipse",
     "Line",
+    "LineBatch",
     "BorderPosition",
     "Path",
     "CurvedCubicLine",
@@ -113,6 +131,7 @@ __all__ = [
     "MathTypst",
     "Blur",
     "Opacity",
+    "Cached",
     "Image",
     "SmoothPath",
     "MatplotlibFigure",
@@ -123,6 +142,7 @@ __all__ = [
     "LabelArrow",
     "tween",
     "EaseType",
+    "ease_batch",
     "Playbook",
     "Animated",
     "Scene",
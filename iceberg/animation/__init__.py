@@ -1 +1,2 @@
+from .ease import ease_batch
 from .tween import EaseType, tween
@@ -1,5 +1,8 @@
 import math
 from enum import Enum
+from typing import Callable, Dict
+
+import numpy as np
 
 
 def linear(x):
@@ -31,8 +34,8 @@ def ease_in_out_quad(x):
     if x < 1:
         return x * x / 2
     else:
-        x -= 1
-        return -(x * (x - 2) - 1) / 2
+        x = 2 - x
+        return 1 - x * x / 2
 
 
 def ease_in_cubic(x):
@@ -50,60 +53,68 @@ def ease_in_out_cubic(x):
         return x * x * x / 2
     else:
         x -= 2
-        return (x * x * x + 2) / 2
+        return x * x * x / 2 + 1
 
 
 def ease_in_quart(x):
-    return x * x * x * x
+    x *= x
+    return x * x
 
 
 def ease_out_quart(x):
     x -= 1
-    return -(x * x * x * x - 1)
+    x *= x
+    return 1 - x * x
 
 
 def ease_in_out_quart(x):
     x *= 2
     if x < 1:
-        return x * x * x * x / 2
+        x *= x
+        return x * x / 2
     else:
         x -= 2
-        return -(x * x * x * x - 2) / 2
+        x *= x
+        return 1 - x * x / 2
 
 
 def ease_in_quint(x):
-    return x * x * x * x * x
+    x_squared = x * x
+    return x_squared * x_squared * x
 
 
 def ease_out_quint(x):
     x -= 1
-    return x * x * x * x * x + 1
+    x_squared = x * x
+    return x_squared * x_squared * x + 1
 
 
 def ease_in_out_quint(x):
     x *= 2
     if x < 1:
-        return x * x * x * x * x / 2
+        x_squared = x * x
+        return x_squared * x_squared * x / 2
     else:
         x -= 2
-        return (x * x * x * x * x + 2) / 2
+        x_squared = x * x
+        return x_squared * x_squared * x / 2 + 1
 
 
 def ease_in_expo(x):
-    return math.pow(2, 10 * (x - 1))
+    return 2.0 ** (10 * (x - 1))
 
 
 def ease_out_expo(x):
-    return -math.pow(2, -10 * x) + 1
+    return -(2.0 ** (-10 * x)) + 1
 
 
 def ease_in_out_expo(x):
     x *= 2
     if x < 1:
-        return math.pow(2, 10 * (x - 1)) / 2
+        return 2.0 ** (10 * (x - 1)) / 2
     else:
         x -= 1
-        return -math.pow(2, -10 * x) - 1
+        return (-(2.0 ** (-10 * x)) + 2) / 2
 
 
 def ease_in_circ(x):
@@ -125,6 +136,14 @@ def ease_in_out_circ(x):
 
 
 class EaseType(Enum):
+    """The built in ease functions.
+
+    Functions assigned in an enum body do not become members, so every attribute here
+    is the plain ease function itself, e.g. `EaseType.EASE_IN_OUT_QUAD(0.5)` calls
+    `ease_in_out_quad` directly with no member lookup. This also means iterating over
+    `EaseType` yields no members.
+    """
+
     LINEAR = linear
     EASE_IN_SINE = ease_in_sine
     EASE_OUT_SINE = ease_out_sine
@@ -147,3 +166,36 @@ class EaseType(Enum):
     EASE_IN_CIRC = ease_in_circ
     EASE_OUT_CIRC = ease_out_circ
     EASE_IN_OUT_CIRC = ease_in_out_circ
+
+
+# Number of samples in the lookup tables used by `ease_batch`.
+_EASE_TABLE_SIZE = 4096
+_EASE_TABLE_XS = np.linspace(0, 1, _EASE_TABLE_SIZE)
+
+# Lookup tables for `ease_batch`, keyed on the ease function and built on first use.
+_EASE_TABLES: Dict[Callable[[float], float], np.ndarray] = {}
+
+
+def ease_batch(ease_fn: Callable[[float], float], xs: np.ndarray) -> np.ndarray:
+    """Ease many progress values at once.
+
+    The ease function is sampled once into a table, and the values are linearly
+    interpolated from it. This is much faster than calling the ease function for every
+    value when easing many values at once. The error is around 1e-6 for most of the
+    built in ease types, but larger close to where the circular ones are vertical.
+
+    Args:
+        ease_fn: The ease function, e.g. `EaseType.EASE_IN_OUT_QUAD`.
+        xs: The progress values, between 0 and 1.
+
+    Returns:
+        The eased values, with the same shape as `xs`.
+    """
+
+    table = _EASE_TABLES.get(ease_fn)
+
+    if table is None:
+        table = np.array([ease_fn(x) for x in _EASE_TABLE_XS.tolist()])
+        _EASE_TABLES[ease_fn] = table
+
+    return np.interp(xs, _EASE_TABLE_XS, table)
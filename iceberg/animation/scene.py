@@ -1,5 +1,20 @@
+import bisect
+import collections
+import concurrent.futures
+import itertools
+import math
+import os
 from abc import ABC, abstractmethod
-from typing import Callable, Sequence, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import av
 import numpy as np
@@ -8,8 +23,10 @@ from absl import logging
 from PIL import Image
 
 from iceberg import Drawable, DrawableWithChild, Renderer
-from iceberg.animation import EaseType, tween
+from iceberg.animation import EaseType
+from iceberg.animation.tween import _interpolate
 from iceberg.core import Bounds, dont_animate
+from iceberg.core.renderer import rasterize_picture, record_picture
 
 
 class Animated(Drawable):
@@ -79,9 +96,17 @@ class Animated(Drawable):
 
         self._states = self.states
         self._total_duration = sum(self._durations) + self.start_time
+
+        # When each pair of states finishes animating, relative to the start time.
+        self._state_end_times = list(itertools.accumulate(self._durations))
         self._start_time = self.start_time
         self.cursor = 0
 
+        # The last drawable built and the time it was built for. The bounds, children
+        # and drawing all ask for the drawable at the same time every frame.
+        self._cached_t = None
+        self._cached_drawable = None
+
     @property
     def total_duration(self) -> float:
         return self._total_duration
@@ -96,6 +121,18 @@ class Animated(Drawable):
             The drawable at time t.
         """
 
+        if t == self._cached_t:
+            return self._cached_drawable
+
+        drawable = self._build_drawable_at_t(t)
+        self._cached_t = t
+        self._cached_drawable = drawable
+
+        return drawable
+
+    def _build_drawable_at_t(self, t: float) -> Drawable:
+        """Builds the drawable at time t, see `_get_drawable_at_t`."""
+
         t -= self._start_time
 
         if t < 0:
@@ -104,16 +141,18 @@ class Animated(Drawable):
         if t >= self._total_duration - self._start_time:
             return self._states[-1]
 
-        time_so_far = 0
-        for i, duration in enumerate(self._durations):
-            if time_so_far + duration > t:
-                break
-            time_so_far += duration
+        # The first state pair that ends after t.
+        i = min(
+            bisect.bisect_right(self._state_end_times, t), len(self._durations) - 1
+        )
+        duration = self._durations[i]
+        time_so_far = self._state_end_times[i - 1] if i > 0 else 0
 
-        # Animate between the states.
+        # Animate between the states. This is `tween` without its argument handling,
+        # as the ease function was already resolved in `setup`.
         progress = (t - time_so_far) / duration
-        return tween(
-            self._states[i], self._states[i + 1], progress, ease_fn=self._ease_fns[i]
+        return _interpolate(
+            self._states[i], self._states[i + 1], self._ease_fns[i](progress)
         )
 
     @property
@@ -198,6 +237,131 @@ class Frozen(DrawableWithChild):
         self.child.draw(canvas)
 
 
+# Times that should land exactly on a frame can be off by float error, e.g. a scene
+# joined after a 0.1 + 0.2 second one, so frame boundaries are found with this slack.
+_FRAME_TIME_TOLERANCE = 1e-6
+
+
+def _frame_count(duration: float, fps: float) -> int:
+    """The number of frames that start within the first `duration` seconds."""
+
+    return math.floor(duration * fps + _FRAME_TIME_TOLERANCE)
+
+
+def _first_frame_at(t: float, fps: float) -> int:
+    """The index of the first frame that starts at or after time t."""
+
+    return math.ceil(t * fps - _FRAME_TIME_TOLERANCE)
+
+
+# The number of frames that may wait to be encoded before drawing blocks.
+_MAX_PENDING_ENCODES = 8
+
+
+def _encode_frame(container, stream, frame: av.VideoFrame) -> None:
+    """Converts a frame to the stream's pixel format, encodes it and muxes the
+    resulting packets into the container."""
+
+    frame = frame.reformat(format=stream.pix_fmt)
+    for packet in stream.encode(frame):
+        container.mux(packet)
+
+
+def _copy_to_video_frame(frame_pixels: np.ndarray, frame: av.VideoFrame) -> None:
+    """Copies an RGBA image into an RGBA video frame of the same size."""
+
+    height, width = frame_pixels.shape[:2]
+    plane = frame.planes[0]
+
+    # Rows of the plane may be padded past the width of the image.
+    rows = np.frombuffer(plane, dtype=np.uint8).reshape(height, plane.line_size)
+    np.copyto(rows[:, : width * 4], frame_pixels.reshape(height, width * 4))
+
+
+def _rasterize_with_renderer(
+    frames: Iterable[Optional[Tuple[Drawable, Bounds]]], renderer: Renderer
+) -> Iterator[np.ndarray]:
+    """Rasterizes drawables one at a time with the given renderer.
+
+    Each frame is a drawable and the viewport to render it in, or None to repeat the
+    previous image. Every image is read into the same buffer while the frame size stays
+    the same, so an image is only valid until the next one is requested.
+    """
+
+    frame_pixels = None
+
+    for frame in frames:
+        if frame is not None:
+            drawable, viewport = frame
+            renderer.render(drawable, viewport=viewport)
+
+            width, height = (
+                int(viewport.width + 0.5),
+                int(viewport.height + 0.5),
+            )
+            if frame_pixels is None or frame_pixels.shape[:2] != (height, width):
+                frame_pixels = np.empty((height, width, 4), dtype=np.uint8)
+
+            renderer.get_rendered_image(out=frame_pixels)
+
+        yield frame_pixels
+
+
+def _rasterize_in_workers(
+    frames: Iterable[Optional[Tuple[Drawable, Bounds]]], num_workers: int
+) -> Iterator[np.ndarray]:
+    """Rasterizes drawables in a pool of worker processes.
+
+    Each drawable is recorded into a Skia picture on the calling thread, which captures
+    its state at that time (drawables such as the ones in a `Playbook` are mutated from
+    frame to frame). Only the rasterization of the recorded pictures is farmed out.
+
+    Args:
+        frames: The drawables to rasterize with the viewports to render them in. A None
+            frame repeats the previous image.
+        num_workers: The number of worker processes to use.
+
+    Yields:
+        The rendered images, in the same order as the drawables.
+    """
+
+    # Bound the number of frames in flight so memory stays flat for long scenes.
+    max_pending = 2 * num_workers
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+        pending = collections.deque()
+        frame_pixels = None
+
+        def _next_result():
+            nonlocal frame_pixels
+
+            future = pending.popleft()
+            if future is not None:
+                frame_pixels = future.result()
+
+            return frame_pixels
+
+        for frame in frames:
+            if frame is None:
+                pending.append(None)
+            else:
+                drawable, viewport = frame
+                pending.append(
+                    executor.submit(
+                        rasterize_picture,
+                        record_picture(drawable, viewport=viewport),
+                        int(viewport.width + 0.5),
+                        int(viewport.height + 0.5),
+                    )
+                )
+
+            if len(pending) >= max_pending:
+                yield _next_result()
+
+        while pending:
+            yield _next_result()
+
+
 class Scene(object):
     """A scene is a short segment of animation.
 
@@ -217,6 +381,15 @@ class Scene(object):
         self._duration = duration
         self._make_frame = make_frame
 
+        # For concatenated scenes, the flat list of (start time, scene) parts that
+        # make up this scene, and the end time of every part for looking them up.
+        # None for scenes that are not concatenations.
+        self._parts = None
+        self._part_ends = None
+
+        # Whether every frame of this scene is the same, e.g. for frozen scenes.
+        self._is_static = False
+
     @property
     def duration(self) -> float:
         """The duration of the scene in seconds."""
@@ -227,16 +400,67 @@ class Scene(object):
 
         return self._make_frame(t)
 
+    def _leaf_parts(self) -> Sequence[Tuple[float, "Scene"]]:
+        """The (start time, scene) parts of this scene, none of which are concatenations."""
+
+        if self._parts is None:
+            return [(0, self)]
+
+        return self._parts
+
+    def _frame_source(self, t: float) -> Tuple["Scene", float]:
+        """Finds the scene that renders time t, and the time within that scene.
+
+        Args:
+            t: The time in seconds.
+
+        Returns:
+            The scene to call `make_frame` on and the time to call it with.
+        """
+
+        if self._parts is None:
+            return self, t
+
+        # The first part that ends after t, or the last part for times past the end.
+        index = min(bisect.bisect_right(self._part_ends, t), len(self._parts) - 1)
+        start, scene = self._parts[index]
+
+        return scene, t - start
+
     def __add__(self, other: "Scene") -> "Scene":
         """Concatenates two scenes together."""
+        return Scene._concatenate([self, other])
+
+    @staticmethod
+    def _concatenate(scenes: Sequence["Scene"]) -> "Scene":
+        """Concatenates many scenes together in one pass.
+
+        Args:
+            scenes: The scenes to play one after the other.
+
+        Returns:
+            The concatenated scene.
+        """
 
         def _make_frame(t: float) -> Drawable:
-            if t < self.duration:
-                return self.make_frame(t)
-            else:
-                return other.make_frame(t - self.duration)
+            scene, scene_t = combined._frame_source(t)
+            return scene.make_frame(scene_t)
+
+        # Keep the timeline flat rather than nesting concatenations, so looking up a
+        # frame does not recurse through every earlier concatenation.
+        parts = []
+        duration = 0
+        for scene in scenes:
+            parts.extend(
+                (duration + start, part) for start, part in scene._leaf_parts()
+            )
+            duration += scene.duration
+
+        combined = Scene(duration, _make_frame)
+        combined._parts = parts
+        combined._part_ends = [start + scene.duration for start, scene in parts]
 
-        return Scene(self.duration + other.duration, _make_frame)
+        return combined
 
     def concat(self, scene: "Scene") -> "Scene":
         """Concatenates two scenes together."""
@@ -244,7 +468,9 @@ class Scene(object):
 
     def freeze(self, duration: float) -> "Scene":
         """Freezes the scene for a given duration."""
-        return Scene(duration, lambda t: self._make_frame(self.duration))
+        frozen = Scene(duration, lambda t: self._make_frame(self.duration))
+        frozen._is_static = True
+        return frozen
 
     def reverse(self) -> "Scene":
         """Reverses the scene."""
@@ -256,6 +482,9 @@ class Scene(object):
         renderer: Renderer = None,
         fps: int = 60,
         progress_bar: bool = True,
+        num_workers: int = 0,
+        codec: str = "libx264",
+        codec_options: Optional[Dict[str, str]] = None,
     ) -> None:
         """Renders the scene to a file.
 
@@ -264,9 +493,23 @@ class Scene(object):
             renderer: The renderer to use. If not specified, a default renderer will be used.
             fps: The frames per second to render at.
             progress_bar: Whether to show a progress bar while rendering.
+            num_workers: The number of worker processes to rasterize frames with. If 0,
+                frames are rasterized by `renderer` on the calling thread. If -1, one
+                worker is used per CPU. Frames are still built and recorded on the
+                calling thread, so `make_frame` need not be picklable.
+            codec: The video encoder to use. Hardware encoders such as `"h264_nvenc"`,
+                `"h264_qsv"` or `"h264_videotoolbox"` encode much faster where they are
+                available, and libx264 is used if the encoder is not in this build of
+                libav. Ignored for GIFs.
+            codec_options: Options for the video encoder, e.g.
+                `{"preset": "veryfast", "crf": "20"}` to encode faster with libx264.
+                Ignored for GIFs.
         """
         _IS_GIF = False
 
+        if num_workers < 0:
+            num_workers = os.cpu_count() or 1
+
         if filename.endswith(".gif"):
             _IS_GIF = True
             possible_fps = [25, 33.3, 50, 100]
@@ -278,69 +521,166 @@ class Scene(object):
 
             fps = min(possible_fps, key=lambda x: abs(x - fps))
 
-        total_frames = int(fps * self.duration)
+        total_frames = _frame_count(self.duration, fps)
+
+        # Frames are assigned to the parts of the scene by integer frame index, so
+        # float error in the start times cannot move a frame across a join.
+        parts = self._leaf_parts()
+        part_start_frames = [_first_frame_at(start, fps) for start, _ in parts]
 
         if renderer is None:
             renderer = Renderer()
 
         bounds = None
 
-        pil_images = []
         container = None
         stream = None
 
         if not _IS_GIF:
             container = av.open(filename, mode="w")
-            stream = container.add_stream("libx264", rate=fps)
-
-        for frame_index in tqdm.trange(total_frames, disable=not progress_bar):
-            t = frame_index / fps
-            frame_drawable = self.make_frame(t)
-
-            if bounds is None:
-                bounds = frame_drawable.bounds.round()
-
-                if not _IS_GIF:
-                    # Force width to be a multiple of 2
-                    if bounds.width % 2 != 0:
-                        bounds = Bounds(
-                            top=bounds.top,
-                            left=bounds.left,
-                            size=(bounds.width - 1, bounds.height),
-                        )
-
-                    stream.width = bounds.width
-                    stream.height = bounds.height
+            try:
+                av.codec.Codec(codec, "w")
+            except ValueError:
+                logging.warning(f"Encoder {codec} is not available, using libx264.")
+                codec = "libx264"
+
+            stream = container.add_stream(codec, rate=fps)
+
+            # Prefer yuv420p, which every player supports, unless the encoder cannot
+            # take it, like some hardware encoders.
+            pixel_formats = [
+                video_format.name
+                for video_format in stream.codec_context.codec.video_formats or ()
+            ]
+            if not pixel_formats or "yuv420p" in pixel_formats:
+                stream.pix_fmt = "yuv420p"
+            else:
+                stream.pix_fmt = pixel_formats[0]
+
+            # Let the encoder pick how many threads to use, and how to split the work
+            # between them.
+            stream.thread_count = 0
+            stream.thread_type = "AUTO"
+
+            if codec_options is not None:
+                stream.options = dict(codec_options)
+
+        # Every frame is rendered in the bounds of the first frame.
+        def _frame_drawables() -> Iterator[Optional[Tuple[Drawable, Bounds]]]:
+            nonlocal bounds
+
+            previous_source = None
+            part_index = 0
+
+            for frame_index in tqdm.trange(total_frames, disable=not progress_bar):
+                while (
+                    part_index + 1 < len(parts)
+                    and part_start_frames[part_index + 1] <= frame_index
+                ):
+                    part_index += 1
+
+                start, source = parts[part_index]
+                source_t = max(frame_index / fps - start, 0.0)
+
+                # Consecutive frames of a static scene are identical, so only the first
+                # one is built and rasterized.
+                if source._is_static and source is previous_source:
+                    yield None
+                    continue
+
+                previous_source = source
+                frame_drawable = source.make_frame(source_t)
+
+                if bounds is None:
+                    bounds = frame_drawable.bounds.round()
+
+                    if not _IS_GIF:
+                        # Force width to be a multiple of 2
+                        if bounds.width % 2 != 0:
+                            bounds = Bounds(
+                                top=bounds.top,
+                                left=bounds.left,
+                                size=(bounds.width - 1, bounds.height),
+                            )
+
+                        stream.width = bounds.width
+                        stream.height = bounds.height
+
+                yield frame_drawable, bounds
+
+        # Only frames from the renderer share a buffer, the workers return a new
+        # array for every image.
+        if num_workers > 0:
+            frames = _rasterize_in_workers(_frame_drawables(), num_workers)
+            frames_share_buffer = False
+        else:
+            frames = _rasterize_with_renderer(_frame_drawables(), renderer)
+            frames_share_buffer = True
 
-            frame_drawable = frame_drawable.crop(bounds)
-            renderer.render(frame_drawable)
-            frame_pixels = renderer.get_rendered_image()
+        if _IS_GIF:
 
-            if not _IS_GIF:
-                frame_pixels = np.round(frame_pixels[:, :, :3]).astype(np.uint8)
-                frame = av.VideoFrame.from_ndarray(frame_pixels, format="rgb24")
-                for packet in stream.encode(frame):
-                    container.mux(packet)
+            def _pil_images() -> Iterator[Image.Image]:
+                for frame_pixels in frames:
+                    # PIL keeps using the array, so a shared buffer needs to be copied.
+                    if frames_share_buffer:
+                        frame_pixels = frame_pixels.copy()
 
-            if _IS_GIF:
-                pil_images.append(Image.fromarray(frame_pixels, mode="RGBA"))
+                    yield Image.fromarray(frame_pixels, mode="RGBA")
 
-        if not _IS_GIF:
-            # Flush stream
-            for packet in stream.encode():
-                container.mux(packet)
-            container.close()
+            # Frames are rendered as PIL writes the GIF, rather than all being kept as
+            # RGBA images until the end. PIL only holds on to its own palettized copy
+            # of each frame.
+            pil_images = _pil_images()
+            first_image = next(pil_images, None)
+            second_image = next(pil_images, None)
 
-        if _IS_GIF:
-            assert len(pil_images) > 1, "No frames were rendered."
-            pil_images[0].save(
+            assert second_image is not None, "No frames were rendered."
+            first_image.save(
                 filename,
                 save_all=True,
-                append_images=pil_images[1:],
+                append_images=itertools.chain([second_image], pil_images),
                 duration=1000 // fps,
                 loop=0,
                 disposal=2,
             )
+        else:
+            # Encode on a background thread, so the next frame is drawn while the
+            # previous ones are encoded. A single thread keeps the frames in order.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as encoder:
+                pending = collections.deque()
+
+                # Video frames are reused in a ring. A frame is only written to again
+                # once it has been encoded, as at most `_MAX_PENDING_ENCODES` other
+                # frames can be pending by then.
+                video_frames = None
+
+                for frame_index, frame_pixels in enumerate(frames):
+                    if video_frames is None:
+                        height, width = frame_pixels.shape[:2]
+                        video_frames = [
+                            av.VideoFrame(width, height, "rgba")
+                            for _ in range(_MAX_PENDING_ENCODES + 1)
+                        ]
+
+                    # The RGBA pixels are copied straight into the frame's own buffer,
+                    # so the frame buffer can be reused. The conversion to YUV, which
+                    # drops the alpha channel, happens on the encoding thread.
+                    frame = video_frames[frame_index % len(video_frames)]
+                    _copy_to_video_frame(frame_pixels, frame)
+                    pending.append(
+                        encoder.submit(_encode_frame, container, stream, frame)
+                    )
+
+                    if len(pending) > _MAX_PENDING_ENCODES:
+                        pending.popleft().result()
+
+                while pending:
+                    pending.popleft().result()
+
+            # Flush stream
+            for packet in stream.encode():
+                container.mux(packet)
+            container.close()
 
     def ipython_display(
         self, fps: int = 60, loop: bool = True, display_format: str = "mp4"
@@ -390,12 +730,12 @@ class Playbook(ABC):
 
         assert len(self._scenes) > 0, "No scenes have been added to the playbook."
 
-        # Add all the scenes together.
-        scene = self._scenes[0]
-        for next_scene in self._scenes[1:]:
-            scene += next_scene
+        if len(self._scenes) == 1:
+            return self._scenes[0]
 
-        return scene
+        # Add all the scenes together at once, rather than one by one, which would copy
+        # the parts of all the earlier scenes for every scene added.
+        return Scene._concatenate(self._scenes)
 
     def frozen(self, drawable: Drawable, t: float = None) -> Drawable:
         """Returns a frozen drawable at time t. If t is not specified, the end of the animation is
@@ -458,6 +798,17 @@ class Playbook(ABC):
         """The timeline method is where the user should add scenes to the playbook."""
         pass
 
+    def render(self, filename: str, **kwargs) -> None:
+        """Renders the combined scene to a file.
+
+        Args:
+            filename: The filename to render to.
+            **kwargs: Passed on to `Scene.render`, e.g. `num_workers=-1` to rasterize
+                frames on every CPU.
+        """
+
+        self.combined_scene.render(filename, **kwargs)
+
     def ipython_display(
         self, fps: int = 60, loop: bool = True, display_format: str = "mp4"
     ) -> None:
@@ -1,4 +1,3 @@
-import dataclasses
 import typing
 from typing import Sequence
 
@@ -8,20 +7,187 @@ import iceberg as ice
 
 from .ease import EaseType
 
+
+def _interpolate_arrays(a: np.ndarray, b: np.ndarray, t: float) -> np.ndarray:
+    # Same as `a + (b - a) * t`, but computed in one buffer instead of allocating a
+    # temporary array for every operation.
+    out = np.subtract(b, a, dtype=np.result_type(a, b, t))
+    out *= t
+    out += a
+    return out
+
+
 _PRIMITIVE_INTERPOLATORS = {
     int: lambda a, b, t: float(a + (b - a) * t),
     float: lambda a, b, t: a + (b - a) * t,
-    np.ndarray: lambda a, b, t: a + (b - a) * t,
+    np.ndarray: _interpolate_arrays,
     bool: lambda a, b, t: a if t < 0.5 else b,
 }
 
 
-def _field_names(fields):
-    return set(field.name for field in fields)
+# How `_interpolate` handles values of a type.
+_KIND_DRAWABLE = 0
+_KIND_SEQUENCE = 1
+_KIND_PRIMITIVE = 2
+_KIND_PROPERTY = 3
+_KIND_OTHER = 4
+
+# Caches for `_resolve_type` and `_classify_type`, so the type checks of `_interpolate`
+# are done once per type rather than for every value interpolated.
+_RESOLVED_TYPES = {}
+_TYPE_KINDS = {}
+
+
+def _resolve_type(type_):
+    """Returns the origin of a type hint like `Tuple[float, float]`, or the type itself."""
+
+    resolved = _RESOLVED_TYPES.get(type_)
+
+    if resolved is None:
+        origin = typing.get_origin(type_)
+        resolved = origin if origin is not None else type_
+        _RESOLVED_TYPES[type_] = resolved
+
+    return resolved
+
+
+def _classify_type(type_):
+    """Returns how values of a type are interpolated, and the primitive interpolator
+    for primitive types."""
+
+    classification = _TYPE_KINDS.get(type_)
+
+    if classification is None:
+        primitive_interpolator = None
+
+        if issubclass(type_, ice.Drawable):
+            kind = _KIND_DRAWABLE
+        # Sequence captures a lot, excluding str is a hack for now.
+        elif issubclass(type_, (list, tuple, Sequence)) and not issubclass(type_, str):
+            kind = _KIND_SEQUENCE
+        elif issubclass(type_, (int, float, np.ndarray)):
+            kind = _KIND_PRIMITIVE
+            # Look up the exact type first, bools are ints and would otherwise be
+            # interpolated like numbers.
+            primitive_interpolator = _PRIMITIVE_INTERPOLATORS.get(type_)
+            if primitive_interpolator is None:
+                primitive_interpolator = next(
+                    func
+                    for primitive_type, func in _PRIMITIVE_INTERPOLATORS.items()
+                    if issubclass(type_, primitive_type)
+                )
+        elif issubclass(type_, ice.AnimatableProperty):
+            kind = _KIND_PROPERTY
+        else:
+            kind = _KIND_OTHER
+
+        classification = (kind, primitive_interpolator)
+        _TYPE_KINDS[type_] = classification
+
+    return classification
+
+
+# The types of numbers a flat sequence can hold to be interpolated in one pass. These
+# are exact types, since bools are ints but are not interpolated like numbers. Numpy
+# float64s are included as they come out of transformed points, e.g. a line's ends.
+_NUMBER_TYPES = frozenset([int, float, np.float64])
+
+
+def _is_number_sequence(values) -> bool:
+    return all(type(value) in _NUMBER_TYPES for value in values)
+
+
+# Generated field interpolators for drawables, keyed on the type of both sides when
+# they are the same, which is almost always, or on the pair of types otherwise. The
+# fields of both types are only compared once, when the interpolator is generated.
+_FIELD_INTERPOLATORS = {}
+
+
+def _make_field_interpolator(type_a, type_b):
+    """Generates a function that interpolates all the fields of two drawables.
+
+    The generated function has one unrolled expression per field, so interpolating a
+    drawable does not have to walk the fields of both drawables every frame.
 
+    Args:
+        type_a: The type of the start drawable.
+        type_b: The type of the end drawable.
+
+    Returns:
+        A function taking the start drawable, the end drawable and the progress, and
+        returning a drawable of `type_a`. This is one of the endpoints when the
+        animated fields of both are the same.
+
+    Raises:
+        ValueError: If the two types do not have the same fields.
+    """
+
+    specs_a = type_a._field_specs
+    specs_b = type_b._field_specs
+
+    names_a = set(name for name, _, _ in specs_a)
+    names_b = set(name for name, _, _ in specs_b)
+
+    if names_a != names_b:
+        raise ValueError(
+            f"Scene graphs don't have the same structure. {type_a} has fields {sorted(names_a)}, but {type_b} has fields {sorted(names_b)}."
+        )
+
+    namespace = {
+        "cls": type_a,
+        "init_from_fields": type_a.init_from_fields,
+        "_interpolate": _interpolate,
+    }
+    statements = []
+    arguments = []
+    shared_checks = []
+
+    for index, (spec_a, spec_b) in enumerate(zip(specs_a, specs_b)):
+        name, a_field_type, animate = spec_a
+        _, b_field_type, animate_b = spec_b
+
+        if not animate:
+            assert not animate_b
+            arguments.append(f"{name}=sceneA.{name} if t < 0.5 else sceneB.{name}")
+            continue
+
+        # Values shared by both sides, like a common child or path style, are reused
+        # without going through `_interpolate`.
+        namespace[f"a_type_{index}"] = a_field_type
+        namespace[f"b_type_{index}"] = b_field_type
+        statements.append(f"a_{index} = sceneA.{name}")
+        statements.append(f"b_{index} = sceneB.{name}")
+        shared_checks.append(f"a_{index} is b_{index}")
+        arguments.append(
+            f"{name}=a_{index} if a_{index} is b_{index} else "
+            f"_interpolate(a_{index}, b_{index}, t, "
+            f"a_type=a_type_{index}, b_type=b_type_{index})"
+        )
+
+    source = "def interpolate_fields(sceneA, sceneB, t):\n"
+    source += "".join(f"    {statement}\n" for statement in statements)
 
-def _should_not_animate(field):
-    return field.metadata.get("iceberg_dont_animate", False)
+    # If none of the animated fields change, like for drawables without any, the
+    # result would have the same fields as the nearer endpoint, so that is returned.
+    if type_a is type_b and not shared_checks:
+        source += "    return sceneA if t < 0.5 else sceneB\n"
+    else:
+        if type_a is type_b:
+            source += f"    if {' and '.join(shared_checks)}:\n"
+            source += "        return sceneA if t < 0.5 else sceneB\n"
+
+        # Same as `cls.from_fields(...)`, without going through its `**kwargs`.
+        source += "    drawable = cls.__new__(cls)\n"
+        source += "    init_from_fields(\n"
+        source += "        drawable,\n"
+        source += "".join(f"        {argument},\n" for argument in arguments)
+        source += "    )\n"
+        source += "    return drawable\n"
+
+    filename = f"<iceberg field interpolator for {type_a.__qualname__}>"
+    exec(compile(source, filename, "exec"), namespace)
+
+    return namespace["interpolate_fields"]
 
 
 def _interpolate(sceneA, sceneB, t, a_type=None, b_type=None):
@@ -29,19 +195,31 @@ def _interpolate(sceneA, sceneB, t, a_type=None, b_type=None):
     # Use the fact that everything is a dataclass, so we can use dataclasses.asdict
     # to get a dictionary representation of the scene.
 
+    # Values shared by both sides, like a drawable or property that is not animated,
+    # are reused as is. Drawables are immutable, so this also keeps anything they
+    # cache, like a path's measure, across frames.
+    if sceneA is sceneB:
+        return sceneA
+
     if sceneA is None or sceneB is None:
         return sceneA if t < 0.5 else sceneB
 
-    a_hint = a_type if a_type is not None else None
-
-    a_type = type(sceneA) if a_type is None else a_type
-    b_type = type(sceneB) if b_type is None else b_type
+    # Leaves like numbers and arrays, whose types match their hints if there are
+    # any, are dispatched on their exact type without resolving the hints.
+    value_type = type(sceneA)
+    if (
+        value_type is type(sceneB)
+        and (a_type is None or a_type is value_type)
+        and (b_type is None or b_type is value_type)
+    ):
+        primitive_interpolator = _PRIMITIVE_INTERPOLATORS.get(value_type)
+        if primitive_interpolator is not None:
+            return primitive_interpolator(sceneA, sceneB, t)
 
-    a_origin = typing.get_origin(a_type)
-    b_origin = typing.get_origin(b_type)
+    a_hint = a_type if a_type is not None else None
 
-    a_type = a_origin if a_origin is not None else a_type
-    b_type = b_origin if b_origin is not None else b_type
+    a_type = _resolve_type(type(sceneA) if a_type is None else a_type)
+    b_type = _resolve_type(type(sceneB) if b_type is None else b_type)
 
     if a_type != b_type:
         raise ValueError(
@@ -51,37 +229,39 @@ def _interpolate(sceneA, sceneB, t, a_type=None, b_type=None):
     if a_type == typing.Union or a_type == typing.Optional or a_type == Ellipsis:
         a_type = type(sceneA)
 
-    if issubclass(a_type, ice.Drawable):
-        fieldsA = dataclasses.fields(sceneA)
-        fieldsB = dataclasses.fields(sceneB)
-
-        if _field_names(fieldsA) != _field_names(fieldsB):
-            raise ValueError(
-                f"Scene graphs don't have the same structure. {sceneA} has fields {fieldsA}, but {sceneB} has fields {fieldsB}."
-            )
-
-        new_scene_fields = {}
-
-        for field, fieldB in zip(fieldsA, fieldsB):
-            fieldA_value = getattr(sceneA, field.name)
-            fieldB_value = getattr(sceneB, field.name)
+    kind, primitive_interpolator = _classify_type(a_type)
 
-            if _should_not_animate(field):
-                assert _should_not_animate(fieldB)
-                new_scene_fields[field.name] = fieldA_value if t < 0.5 else fieldB_value
-                continue
+    if kind == _KIND_DRAWABLE:
+        drawable_type_a = type(sceneA)
+        drawable_type_b = type(sceneB)
+        key = (
+            drawable_type_a
+            if drawable_type_a is drawable_type_b
+            else (drawable_type_a, drawable_type_b)
+        )
+        interpolate_fields = _FIELD_INTERPOLATORS.get(key)
 
-            new_scene_fields[field.name] = _interpolate(
-                fieldA_value,
-                fieldB_value,
-                t,
-                a_type=field.type,
-                b_type=fieldB.type,
+        if interpolate_fields is None:
+            interpolate_fields = _make_field_interpolator(
+                drawable_type_a, drawable_type_b
             )
+            _FIELD_INTERPOLATORS[key] = interpolate_fields
+
+        return interpolate_fields(sceneA, sceneB, t)
+    elif kind == _KIND_SEQUENCE:
+        # Arrays stored in fields hinted as sequences, like points given as arrays, are
+        # interpolated as whole arrays rather than element by element.
+        if isinstance(sceneA, np.ndarray) and isinstance(sceneB, np.ndarray):
+            return _PRIMITIVE_INTERPOLATORS[np.ndarray](sceneA, sceneB, t)
+
+        # Flat sequences of numbers, like points, are interpolated in one pass instead
+        # of dispatching on the type of every element.
+        if _is_number_sequence(sceneA) and _is_number_sequence(sceneB):
+            rv = [float(a + (b - a) * t) for a, b in zip(sceneA, sceneB)]
+            if isinstance(sceneA, tuple):
+                return tuple(rv)
+            return rv
 
-        return sceneA.__class__.from_fields(**new_scene_fields)
-    # Sequence captures a lot, excluding str is a hack for now.
-    elif issubclass(a_type, (list, tuple, Sequence)) and not issubclass(a_type, str):
         sub_type = [None] * len(sceneA)
         if a_hint:
             if len(a_hint.__args__) == len(sceneA):
@@ -96,11 +276,9 @@ def _interpolate(sceneA, sceneB, t, a_type=None, b_type=None):
         if isinstance(sceneA, tuple):
             return tuple(rv)
         return rv
-    elif issubclass(a_type, (int, float, np.ndarray)):
-        for type_, func in _PRIMITIVE_INTERPOLATORS.items():
-            if issubclass(a_type, type_):
-                return func(sceneA, sceneB, t)
-    elif issubclass(a_type, ice.AnimatableProperty):
+    elif kind == _KIND_PRIMITIVE:
+        return primitive_interpolator(sceneA, sceneB, t)
+    elif kind == _KIND_PROPERTY:
         sceneA: ice.AnimatableProperty = sceneA
         return sceneA.__class__.interpolate(sceneA, sceneB, t)
 
@@ -1,67 +1,21 @@
+import math
 from enum import Enum
 from typing import Tuple
 
 import numpy as np
+import skia
 
 from iceberg import Drawable, DrawableWithChild, PathStyle
-from iceberg.primitives import Compose, Line, PartialPath, Transform
+from iceberg.primitives import Compose, Line, PartialPath, Path, Transform
 
-from .helpers import ArrowHead, ArrowHeadStyle
-
-
-def arrow_corners_from_direction_and_point(
-    point: Tuple[float, float],
-    direction: Tuple[float, float],
-    angle_degrees: float,
-    distance: float,
-) -> Tuple[Tuple[float, float], Tuple[float, float]]:
-    # Compute the direction of the arrow.
-    direction = -np.array(direction, dtype=np.float32)
-    direction /= np.linalg.norm(direction)
-
-    point = np.array(point, dtype=np.float32)
-
-    # Compute the angle of the arrow.
-    angle = np.deg2rad(angle_degrees)
-
-    # Compute the two corners of the arrow.
-    corner1 = point + distance * (
-        direction * np.cos(angle)
-        + np.array([-direction[1], direction[0]]) * np.sin(angle)
-    )
-    corner2 = point + distance * (
-        direction * np.cos(angle)
-        + np.array([direction[1], -direction[0]]) * np.sin(angle)
-    )
-
-    return corner1, corner2
-
-
-def arrow_corners(
-    start: Tuple[float, float],
-    end: Tuple[float, float],
-    angle_degrees: float,
-    distance: float,
-) -> Tuple[Tuple[float, float], Tuple[float, float]]:
-    """Given a start and end coordinate, and an angle, compute where the two corners of the arrow are.
-
-    Args:
-        start: The start coordinate.
-        end: The end coordinate.
-        angle_degrees: The angle of the arrow.
-        distance: The distance from the end coordinate to the arrow tip.
-
-    Returns:
-        The two corners of the arrow.
-    """
-
-    # Compute the direction of the arrow.
-    direction = np.array(end, dtype=np.float32) - np.array(start)
-    direction /= np.linalg.norm(direction)
-
-    return arrow_corners_from_direction_and_point(
-        end, direction, angle_degrees, distance
-    )
+from .helpers import (
+    ArrowHeadStyle,
+    arrow_corners,
+    arrow_corners_from_direction_and_point,
+    arrow_head_backup_length,
+    arrow_head_fill_style,
+    arrow_head_skia_path,
+)
 
 
 class Arrow(DrawableWithChild):
@@ -78,6 +32,10 @@ class Arrow(DrawableWithChild):
         arrow_head_end: Whether to draw an arrow head at the end.
         partial_start: The fraction of the arrow to draw at the start.
         partial_end: The fraction of the arrow to draw at the end.
+
+    The line and the outlines of the arrow heads are stroked as one path, with filled
+    heads filled underneath it. With a translucent `line_path_style`, overlapping
+    strokes are blended once and the line is drawn over the head fill.
     """
 
     start: Tuple[float, float]
@@ -118,9 +76,14 @@ class Arrow(DrawableWithChild):
         )
 
     def setup(self):
-        self._midpoint = (np.array(self.start) + np.array(self.end)) / 2
-        self._start = np.array(self.start)
-        self._end = np.array(self.end)
+        # The points are only 2D, so they are kept as plain floats rather than small
+        # numpy arrays.
+        start_x, start_y = float(self.start[0]), float(self.start[1])
+        end_x, end_y = float(self.end[0]), float(self.end[1])
+
+        self._midpoint = ((start_x + end_x) / 2, (start_y + end_y) / 2)
+        self._start = (start_x, start_y)
+        self._end = (end_x, end_y)
         self._path_style = self.line_path_style
         self._head_length = self.head_length
         self._angle = self.angle
@@ -131,8 +94,12 @@ class Arrow(DrawableWithChild):
         self._partial_end = self.partial_end
 
         # Compute the direction of the arrow.
-        direction = self._end - self._start
-        direction /= np.linalg.norm(direction)
+        direction_x = end_x - start_x
+        direction_y = end_y - start_y
+        norm = math.hypot(direction_x, direction_y)
+        inverse_norm = 1.0 / norm if norm > 0 else math.nan
+        direction_x *= inverse_norm
+        direction_y *= inverse_norm
 
         # We put in a lot of effort to make sure that the arrow head actually =
         # ends at the end of the line. If the arrow head has thickness, then
@@ -142,16 +109,12 @@ class Arrow(DrawableWithChild):
         backup_length = 0
 
         if self._arrow_head_end or self._arrow_head_start:
-            # Create a fake arrow head to measure its length.
-            fake_head = ArrowHead(
-                (0, 0),
-                (1, 0),
+            backup_length = arrow_head_backup_length(
                 self._path_style,
                 self._angle,
                 self._head_length,
                 self._arrow_head_style,
             )
-            backup_length = fake_head.bounds.right
 
         # Modified start and end points.
         # By default there is no modification.
@@ -160,70 +123,86 @@ class Arrow(DrawableWithChild):
 
         # Back-up or advance the start and end points.
         if self._arrow_head_end:
-            self._line_end -= direction * backup_length
+            self._line_end = (
+                end_x - direction_x * backup_length,
+                end_y - direction_y * backup_length,
+            )
 
         if self._arrow_head_start:
-            self._line_start += direction * backup_length
-
-        items = []
-
-        # Draw the line.
-        line = PartialPath(
-            Line(self._line_start, self._line_end, self._path_style),
-            self._partial_start,
-            self._partial_end,
-            # We want to subdivide the line into 1 pixel increments
-            # for performance reasons because we know that the line
-            # is straight.
-            subdivide_increment=1,
-        )
-        items.append(line)
+            self._line_start = (
+                start_x + direction_x * backup_length,
+                start_y + direction_y * backup_length,
+            )
 
-        # Draw the arrow heads.
-        head_start = line.points[0]
-        head_end = line.points[-1]
-        head_start_tangent = line.tangents[0]
-        head_end_tangent = line.tangents[-1]
+        if self._partial_start == 0 and self._partial_end == 1:
+            # The whole line is drawn, so its ends and direction are known without
+            # subdividing it.
+            line_path = skia.Path()
+            line_path.moveTo(*self._line_start)
+            line_path.lineTo(*self._line_end)
+
+            head_start = self._line_start
+            head_end = self._line_end
+            head_end_tangent = (
+                self._line_end[0] - self._line_start[0],
+                self._line_end[1] - self._line_start[1],
+            )
+            head_start_tangent = head_end_tangent
+        else:
+            # Draw the line.
+            line = PartialPath(
+                Line(self._line_start, self._line_end, self._path_style),
+                self._partial_start,
+                self._partial_end,
+                # The increment is a fraction of the whole path, so this
+                # samples only the two ends of the drawn part. That is all a
+                # straight line needs, however long it is.
+                subdivide_increment=1,
+            )
+            line_path = line.skia_path
 
-        head_start = tuple(head_start)
-        head_end = tuple(head_end)
-        head_start_tangent = tuple(head_start_tangent)
-        head_end_tangent = tuple(head_end_tangent)
+            # Draw the arrow heads.
+            head_start = tuple(line.points[0])
+            head_end = tuple(line.points[-1])
+            head_start_tangent = tuple(line.tangents[0])
+            head_end_tangent = tuple(line.tangents[-1])
+
+        heads = []
 
         if self._arrow_head_end:
-            items.append(
-                ArrowHead(
-                    head_end,
-                    head_end_tangent,
-                    self._path_style,
-                    self._angle,
-                    self._head_length,
-                    self._arrow_head_style,
-                )
-            )
+            heads.append((head_end, head_end_tangent))
 
         if self._arrow_head_start:
             # Negate the tangent to get the direction of the arrow head.
             x, y = head_start_tangent
-            head_start_tangent = (-x, -y)
-
-            items.append(
-                ArrowHead(
-                    head_start,
-                    head_start_tangent,
-                    self._path_style,
+            heads.append((head_start, (-x, -y)))
+
+        # The line and the outlines of the heads share a style, so they are drawn as
+        # a single path. The line does not enclose anything, so filling the path only
+        # fills the heads.
+        outline = skia.Path(line_path)
+
+        for point, direction in heads:
+            outline.addPath(
+                arrow_head_skia_path(
+                    point,
+                    direction,
                     self._angle,
                     self._head_length,
                     self._arrow_head_style,
                 )
             )
 
-        self.set_child(Compose(items))
+        fill_style = None
+        if self._arrow_head_style == ArrowHeadStyle.FILLED_TRIANGLE:
+            fill_style = arrow_head_fill_style(self._path_style)
+
+        self.set_child(Path.from_skia(outline, self._path_style, fill_style))
 
     @property
     def midpoint(self) -> np.ndarray:
         """The midpoint of the arrow."""
-        return self._midpoint
+        return np.array(self._midpoint)
 
 
 class ArrowAlignDirection(Enum):
@@ -251,27 +230,34 @@ class LabelArrow(DrawableWithChild):
     rotated: bool = False
 
     def setup(self):
-        # Find normal vector.
-        direction = (np.array(self.arrow.end) - np.array(self.arrow.start)).astype(
-            np.float32
-        )
-        direction /= np.linalg.norm(direction)
-        normal = np.array([-direction[1], direction[0]], dtype=np.float32)
-        normal /= np.linalg.norm(normal)
+        # Find the direction of the arrow. The vectors are only 2D, so this is all done
+        # with plain floats rather than small numpy arrays.
+        start_x, start_y = self.arrow.start
+        end_x, end_y = self.arrow.end
+        direction_x = float(end_x - start_x)
+        direction_y = float(end_y - start_y)
+
+        norm = math.hypot(direction_x, direction_y)
+        inverse_norm = 1.0 / norm if norm > 0 else math.nan
+        direction_x *= inverse_norm
+        direction_y *= inverse_norm
 
-        angle = np.arctan2(direction[1], direction[0]) if self.rotated else 0
+        angle = math.atan2(direction_y, direction_x) if self.rotated else 0
 
-        # Compute the displacement.
-        displacement = self.distance * normal
+        # Compute the displacement along the normal, which is already unit length.
+        displacement_x = -direction_y * self.distance
+        displacement_y = direction_x * self.distance
 
         # Placement above or below.
         if self.placement == ArrowAlignDirection.ABOVE:
-            displacement *= -1
+            displacement_x = -displacement_x
+            displacement_y = -displacement_y
 
-        arrow_point = self.arrow.midpoint + displacement
+        midpoint_x, midpoint_y = self.arrow.midpoint
+        corner_x, corner_y = self.child.bounds.corners[self.child_corner]
 
-        delta = arrow_point - self.child.bounds.corners[self.child_corner]
-        dx, dy = delta
+        dx = midpoint_x + displacement_x - corner_x
+        dy = midpoint_y + displacement_y - corner_y
 
         if self.rotated:
             cx, cy = self.child.bounds.center
@@ -1,3 +1,5 @@
+import functools
+import math
 from copy import copy
 from enum import Enum
 from typing import Optional, Tuple
@@ -10,29 +12,42 @@ from iceberg.primitives.layout import Compose
 from iceberg.primitives.shapes import PartialPath, Path
 
 
+@functools.lru_cache(maxsize=64)
+def _cos_sin_degrees(angle_degrees: float) -> Tuple[float, float]:
+    # Arrow heads almost always use the same few angles, so their cosine and sine are
+    # only computed once.
+    angle = math.radians(angle_degrees)
+    return math.cos(angle), math.sin(angle)
+
+
 def arrow_corners_from_direction_and_point(
     point: Tuple[float, float],
     direction: Tuple[float, float],
     angle_degrees: float,
     distance: float,
 ) -> Tuple[Tuple[float, float], Tuple[float, float]]:
-    # Compute the direction of the arrow.
-    direction = -np.array(direction, dtype=np.float32)
-    direction /= np.linalg.norm(direction)
+    # The vectors are only 2D, so this is all done with plain floats rather than small
+    # numpy arrays.
+    px, py = float(point[0]), float(point[1])
+    dx, dy = float(direction[0]), float(direction[1])
 
-    point = np.array(point, dtype=np.float32)
+    # Compute the direction of the arrow, pointing back from its tip.
+    norm = math.hypot(dx, dy)
+    inverse_norm = -1.0 / norm if norm > 0 else math.nan
+    dx *= inverse_norm
+    dy *= inverse_norm
 
     # Compute the angle of the arrow.
-    angle = np.deg2rad(angle_degrees)
+    cos, sin = _cos_sin_degrees(angle_degrees)
 
-    # Compute the two corners of the arrow.
-    corner1 = point + distance * (
-        direction * np.cos(angle)
-        + np.array([-direction[1], direction[0]]) * np.sin(angle)
+    # Compute the two corners of the arrow, by rotating the direction both ways.
+    corner1 = (
+        px + distance * (dx * cos - dy * sin),
+        py + distance * (dy * cos + dx * sin),
     )
-    corner2 = point + distance * (
-        direction * np.cos(angle)
-        + np.array([direction[1], -direction[0]]) * np.sin(angle)
+    corner2 = (
+        px + distance * (dx * cos + dy * sin),
+        py + distance * (dy * cos - dx * sin),
     )
 
     return corner1, corner2
@@ -56,15 +71,55 @@ def arrow_corners(
         The two corners of the arrow.
     """
 
-    # Compute the direction of the arrow.
-    direction = np.array(end, dtype=np.float32) - np.array(start)
-    direction /= np.linalg.norm(direction)
+    # Compute the direction of the arrow, it is normalized when computing the corners.
+    direction = (end[0] - start[0], end[1] - start[1])
 
     return arrow_corners_from_direction_and_point(
         end, direction, angle_degrees, distance
     )
 
 
+def arrow_corners_batch(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    angle_degrees: float,
+    distance: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the corners of many arrows at once, see `arrow_corners`.
+
+    Args:
+        starts: The (N, 2) start coordinates.
+        ends: The (N, 2) end coordinates.
+        angle_degrees: The angle of the arrows.
+        distance: The distance from the end coordinates to the arrow tips.
+
+    Returns:
+        The two (N, 2) arrays of corners of the arrows.
+    """
+
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+
+    # Compute the directions of the arrows, pointing back from their tips. Arrows
+    # without a direction get NaN corners, like in `arrow_corners`.
+    directions = starts - ends
+    with np.errstate(invalid="ignore", divide="ignore"):
+        directions /= np.hypot(directions[:, 0], directions[:, 1])[:, None]
+
+    cos, sin = _cos_sin_degrees(angle_degrees)
+    cos *= distance
+    sin *= distance
+
+    # Compute the two corners of the arrows, by rotating and scaling the directions
+    # both ways with a single 2x2 matrix product each.
+    corners1 = directions @ np.array([[cos, sin], [-sin, cos]])
+    corners1 += ends
+    corners2 = directions @ np.array([[cos, -sin], [sin, cos]])
+    corners2 += ends
+
+    return corners1, corners2
+
+
 class ArrowHeadStyle(Enum):
     TRIANGLE = 0
     FILLED_TRIANGLE = 1
@@ -108,38 +163,118 @@ class ArrowHead(DrawableWithChild):
         )
 
     def setup(self):
-        items = []
-
-        corners = arrow_corners_from_direction_and_point(
-            self.point, self.direction, self.angle, self.head_length
+        path = arrow_head_skia_path(
+            self.point,
+            self.direction,
+            self.angle,
+            self.head_length,
+            self.arrow_head_style,
         )
 
+        # Filled arrow heads fill and stroke the same path in one drawable.
+        fill_style = None
         if self.arrow_head_style == ArrowHeadStyle.FILLED_TRIANGLE:
-            head_path_style = PathStyle(
-                color=self.line_path_style.color,
-                stroke=False,
-                anti_alias=self.line_path_style.anti_alias,
-            )
+            fill_style = arrow_head_fill_style(self.line_path_style)
 
-            path = skia.Path()
-            path.moveTo(*corners[0])
-            path.lineTo(*self.point)
-            path.lineTo(*corners[1])
-            path.close()
+        self.set_child(Path.from_skia(path, self.line_path_style, fill_style))
 
-            items.append(Path.from_skia(path, head_path_style))
-            items.append(Path.from_skia(path, self.line_path_style))
-        elif self.arrow_head_style == ArrowHeadStyle.TRIANGLE:
-            path = skia.Path()
-            path.moveTo(*corners[0])
-            path.lineTo(*self.point)
-            path.lineTo(*corners[1])
 
-            items.append(Path.from_skia(path, self.line_path_style))
-        else:
-            raise ValueError(f"Unknown arrow head style {self.arrow_head_style}.")
+def arrow_head_skia_path(
+    point: Tuple[float, float],
+    direction: Tuple[float, float],
+    angle: float,
+    head_length: float,
+    arrow_head_style: ArrowHeadStyle,
+) -> skia.Path:
+    """Create the outline of an arrow head.
 
-        self.set_child(Compose(items))
+    Args:
+        point: The point of the arrow head.
+        direction: The direction of the arrow head.
+        angle: The angle of the arrow head in degrees.
+        head_length: The length of the arrow head.
+        arrow_head_style: The style of the arrow head.
+
+    Returns:
+        The outline, which is closed for filled arrow heads.
+
+    Raises:
+        ValueError: If the arrow head style is unknown.
+    """
+
+    if arrow_head_style not in (
+        ArrowHeadStyle.TRIANGLE,
+        ArrowHeadStyle.FILLED_TRIANGLE,
+    ):
+        raise ValueError(f"Unknown arrow head style {arrow_head_style}.")
+
+    corners = arrow_corners_from_direction_and_point(
+        point, direction, angle, head_length
+    )
+
+    # Add the whole outline in one call, rather than point by point.
+    path = skia.Path()
+    path.addPoly(
+        [skia.Point(*corners[0]), skia.Point(*point), skia.Point(*corners[1])],
+        arrow_head_style == ArrowHeadStyle.FILLED_TRIANGLE,
+    )
+
+    return path
+
+
+def arrow_head_fill_style(line_path_style: PathStyle) -> PathStyle:
+    """The style to fill arrow heads with, for a given line style."""
+
+    return PathStyle.get(
+        color=line_path_style.color,
+        stroke=False,
+        anti_alias=line_path_style.anti_alias,
+    )
+
+
+def arrow_head_backup_length(
+    line_path_style: PathStyle,
+    angle: float,
+    head_length: float,
+    arrow_head_style: ArrowHeadStyle,
+) -> float:
+    """How far an arrow head pointing at the origin extends past it, including the
+    thickness of its lines. Lines are shortened by this much so the head ends at the
+    end of the line.
+
+    Args:
+        line_path_style: The style of the line.
+        angle: The angle of the arrow head in degrees.
+        head_length: The length of the arrow head.
+        arrow_head_style: The style of the arrow head.
+
+    Returns:
+        The backup length.
+    """
+
+    # Path styles compare and hash by value, so equal styles share a cache entry.
+    return _arrow_head_backup_length(
+        line_path_style, angle, head_length, arrow_head_style
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _arrow_head_backup_length(
+    line_path_style: PathStyle,
+    angle: float,
+    head_length: float,
+    arrow_head_style: ArrowHeadStyle,
+) -> float:
+    # Create a fake arrow head to measure its length.
+    fake_head = ArrowHead(
+        (0, 0),
+        (1, 0),
+        line_path_style,
+        angle,
+        head_length,
+        arrow_head_style,
+    )
+    return fake_head.bounds.right
 
 
 class ArrowPath(DrawableWithChild):
@@ -189,25 +324,15 @@ class ArrowPath(DrawableWithChild):
         backup_t = 0
 
         if self.arrow_head_end or self.arrow_head_start:
-            # Create a fake arrow head to measure its length.
-            fake_head = ArrowHead(
-                (0, 0),
-                (1, 0),
+            backup_length = arrow_head_backup_length(
                 _arrow_path_style,
                 self.angle,
                 self.head_length,
                 self.arrow_head_style,
             )
-            backup_length = fake_head.bounds.right
-            # Create a fake line to figure out where to backup to
-            fake_line = PartialPath(
-                self.child_path,
-                self.partial_start,
-                self.partial_end,
-                self.subdivide_increment,
-                interpolation=self.interpolation,
-            )
-            backup_t = backup_length / fake_line.total_length
+            # Figure out where to backup to. Only the length of the full path is needed
+            # for that, so measure it directly instead of subdividing a fake line.
+            backup_t = backup_length / self.child_path.length
 
         # Modified start and end points.
         # By default there is no modification.
@@ -244,7 +369,8 @@ class ArrowPath(DrawableWithChild):
         available_length = line.total_length * (self._partial_end - self._partial_start)
         if self.arrow_head_start and self.arrow_head_end:
             available_length /= 2
-        cos = np.cos(np.deg2rad(self.angle))
+        head_length = self.head_length
+        cos, _ = _cos_sin_degrees(self.angle)
         if cos > 0:
             max_head_length = available_length / cos
             head_length = min(self.head_length, max_head_length)
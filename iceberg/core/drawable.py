@@ -8,7 +8,6 @@ import functools
 from abc import ABC, abstractmethod, abstractproperty
 from dataclasses import dataclass, MISSING
 from iceberg.core import Bounds, Corner, Color, Colors
-from iceberg.utils import direction_equal
 import numpy as np
 import skia
 import dataclasses
@@ -29,6 +28,14 @@ def copy_func(f):
     return g
 
 
+# The corners `next_to` aligns for each direction sign, as (anchor, other) corners.
+_NEXT_TO_CORNERS = {
+    (1, 0): (Corner.MIDDLE_RIGHT, Corner.MIDDLE_LEFT),
+    (0, 1): (Corner.BOTTOM_MIDDLE, Corner.TOP_MIDDLE),
+    (-1, 0): (Corner.MIDDLE_LEFT, Corner.MIDDLE_RIGHT),
+    (0, -1): (Corner.TOP_MIDDLE, Corner.BOTTOM_MIDDLE),
+}
+
 # Global variable to store the stack of scene contexts.
 _scene_context_stack = []
 
@@ -150,6 +157,17 @@ class Drawable(ABC, DrawableBase):
 
         cls.init_from_fields = copy_func(cls.__init__)
 
+        # The name, type and whether to animate every field, worked out once per class
+        # so animating drawables does not have to inspect field metadata.
+        cls._field_specs = tuple(
+            (
+                field.name,
+                field.type,
+                not field.metadata.get("iceberg_dont_animate", False),
+            )
+            for field in dataclasses.fields(cls)
+        )
+
         if init_already_defined:
             cls.__init__ = cls._original_init
             del cls._original_init
@@ -460,26 +478,17 @@ class Drawable(ABC, DrawableBase):
 
         from iceberg.primitives.layout import Align, Directions
 
-        sign = np.sign(direction)
+        # The direction only has two components, so its signs are worked out with plain
+        # floats rather than numpy calls on a tiny array.
+        dx, dy = float(direction[0]), float(direction[1])
+        sign = ((dx > 0) - (dx < 0), (dy > 0) - (dy < 0))
 
-        if np.sum(np.abs(sign)) > 1:
+        if abs(sign[0]) + abs(sign[1]) > 1:
             raise ValueError("`next_to` can only move in cardinal directions.")
 
-        anchor_corner = Corner.CENTER
-        other_corner = Corner.CENTER
-
-        if direction_equal(direction, Directions.RIGHT):
-            anchor_corner = Corner.MIDDLE_RIGHT
-            other_corner = Corner.MIDDLE_LEFT
-        elif direction_equal(direction, Directions.DOWN):
-            anchor_corner = Corner.BOTTOM_MIDDLE
-            other_corner = Corner.TOP_MIDDLE
-        elif direction_equal(direction, Directions.LEFT):
-            anchor_corner = Corner.MIDDLE_LEFT
-            other_corner = Corner.MIDDLE_RIGHT
-        elif direction_equal(direction, Directions.UP):
-            anchor_corner = Corner.TOP_MIDDLE
-            other_corner = Corner.BOTTOM_MIDDLE
+        anchor_corner, other_corner = _NEXT_TO_CORNERS.get(
+            sign, (Corner.CENTER, Corner.CENTER)
+        )
 
         if no_gap:
             direction = Directions.ORIGIN
@@ -573,6 +582,101 @@ class Drawable(ABC, DrawableBase):
         transform = self.child_transform(search_child)
         return search_child.bounds.transform(transform)
 
+    def children_transforms(self, search_children: Sequence["Drawable"]) -> np.ndarray:
+        """Get the transformation matrices from this drawable to many children at once.
+
+        This gives the same result as calling `child_transform` for every child, but
+        walks the drawable tree only once instead of once per child.
+
+        Args:
+            search_children: The children to search for.
+
+        Returns:
+            A (N, 3, 3) array with the transformation matrix for every child, in order.
+
+        Raises:
+            ChildNotFoundError: If any of the children is not a child of this drawable.
+        """
+
+        from iceberg.primitives.layout import Transform
+
+        # Map each child to the indices it appears at in the output.
+        remaining = {}
+        for index, search_child in enumerate(search_children):
+            remaining.setdefault(id(search_child), []).append(index)
+
+        transforms = np.empty((len(search_children), 3, 3))
+
+        # Pre-order depth first traversal, in the same order as `child_transform`.
+        stack = [(self, np.eye(3))]
+        while stack and remaining:
+            drawable, transform = stack.pop()
+
+            indices = remaining.pop(id(drawable), None)
+            if indices is not None:
+                transforms[indices] = transform
+
+            for child in reversed(drawable.children):
+                if isinstance(child, Transform):
+                    stack.append((child, transform @ child.transform))
+                else:
+                    stack.append((child, transform))
+
+        if remaining:
+            raise ChildNotFoundError()
+
+        return transforms
+
+    def children_corners(
+        self, search_children: Sequence["Drawable"], corner: int
+    ) -> np.ndarray:
+        """Get a corner of the bounds of many children relative to this drawable.
+
+        This is the batched version of `child_bounds(child).corners[corner]`.
+
+        Args:
+            search_children: The children to search for.
+            corner: The corner to get, see `Corner`.
+
+        Returns:
+            A (N, 2) array with the corner of every child, in order.
+
+        Raises:
+            ChildNotFoundError: If any of the children is not a child of this drawable.
+        """
+
+        transforms = self.children_transforms(search_children)
+
+        # Transform the top left and bottom right corners, like `Bounds.transform`.
+        top_lefts = np.array(
+            [(child.bounds.left, child.bounds.top, 1) for child in search_children]
+        ).reshape(-1, 3)
+        bottom_rights = np.array(
+            [(child.bounds.right, child.bounds.bottom, 1) for child in search_children]
+        ).reshape(-1, 3)
+
+        lefts, tops = np.einsum("nij,nj->ni", transforms, top_lefts)[:, :2].T
+        rights, bottoms = np.einsum("nij,nj->ni", transforms, bottom_rights)[:, :2].T
+
+        xs = (lefts, lefts + (rights - lefts) / 2, rights)
+        ys = (tops, tops + (bottoms - tops) / 2, bottoms)
+
+        # The (x, y) components of each corner, indexed by `Corner`.
+        corner_components = (
+            (0, 0),
+            (1, 0),
+            (2, 0),
+            (2, 1),
+            (2, 2),
+            (1, 2),
+            (0, 2),
+            (0, 1),
+            (1, 1),
+        )
+        x_index, y_index = corner_components[corner]
+
+        return np.stack([xs[x_index], ys[y_index]], axis=1)
+
     def child_transformed_point(
         self, search_child: "Drawable", point: Tuple[float, float]
     ) -> Tuple[float, float]:
@@ -604,13 +708,18 @@ class Drawable(ABC, DrawableBase):
             A list of all children that satisfy the specified condition.
         """
 
+        # Walk the tree in pre-order with an explicit stack, so matches are collected
+        # into a single list instead of being copied up through every level.
         children = []
+        stack = [self]
 
-        if condition(self):
-            children.append(self)
+        while stack:
+            drawable = stack.pop()
 
-        for child in self.children:
-            children.extend(child.find_all(condition))
+            if condition(drawable):
+                children.append(drawable)
+
+            stack.extend(reversed(drawable.children))
 
         return children
 
@@ -1,6 +1,7 @@
+import functools
 from dataclasses import dataclass
 
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 from typing_extensions import Self
 from enum import Enum
 from abc import ABC, abstractclassmethod
@@ -32,7 +33,7 @@ class AnimatableProperty(ABC):
 
 
 def _interpolate_tuple(start, end, progress):
-    return tuple(start[i] + (end[i] - start[i]) * progress for i in range(len(start)))
+    return tuple([a + (b - a) * progress for a, b in zip(start, end)])
 
 
 class Bounds(AnimatableProperty):
@@ -338,6 +339,9 @@ class Color(AnimatableProperty):
         self._b = b
         self._a = a
 
+        # Packed float32 RGBA for Skia, created on first use.
+        self._skia_color = None
+
     @classmethod
     def interpolate(cls, start: Self, end: Self, progress: float):
         vectorsA = [start.r, start.g, start.b, start.a]
@@ -364,9 +368,24 @@ class Color(AnimatableProperty):
     def with_alpha(self, alpha: float) -> "Color":
         return Color(self.r, self.g, self.b, alpha)
 
+    def __getstate__(self) -> dict:
+        # The cached Skia color cannot be pickled or copied, it is created again on
+        # first use instead.
+        state = self.__dict__.copy()
+        state["_skia_color"] = None
+        return state
+
     def to_skia(self) -> skia.Color4f:
-        """Get the color as a skia.Color4f."""
-        return skia.Color4f(self.r, self.g, self.b, self.a)
+        """Get the color as a skia.Color4f.
+
+        Colors are immutable, so the result is cached and shared between calls. It
+        must not be modified.
+        """
+
+        if self._skia_color is None:
+            self._skia_color = skia.Color4f(self.r, self.g, self.b, self.a)
+
+        return self._skia_color
 
     def to_hex(self) -> str:
         """Get the color as a hex string.
@@ -391,9 +410,13 @@ class Color(AnimatableProperty):
         return cls(color.r, color.g, color.b, color.a)
 
     @classmethod
+    @functools.lru_cache(maxsize=256)
     def from_hex(cls, hex: str) -> "Color":
         """Create a color object from a hex string.
 
+        Colors are immutable, so the parsed color is cached and shared between
+        calls with the same string.
+
         Args:
             hex: The hex string to create the color from.
 
@@ -556,6 +579,39 @@ class PathStyle(AnimatableProperty):
             else None,
         )
 
+    @classmethod
+    def get(
+        cls,
+        color: Color = Colors.BLACK,
+        thickness: float = 1.0,
+        anti_alias: bool = True,
+        stroke: bool = True,
+        stroke_cap: StrokeCap = StrokeCap.BUTT,
+        dashed: bool = False,
+        dash_intervals: Sequence[float] = (20, 10),
+        dash_phase: float = 0,
+    ) -> "PathStyle":
+        """Get a shared path style, creating it the first time it is asked for.
+
+        Path styles are immutable, so drawables that are built often, e.g. lines in
+        every frame, can share one style and its Skia paint instead of each creating
+        their own. Takes the same arguments as the constructor.
+
+        Returns:
+            The path style.
+        """
+
+        return _shared_path_style(
+            color,
+            thickness,
+            anti_alias,
+            stroke,
+            stroke_cap,
+            dashed,
+            tuple(dash_intervals),
+            dash_phase,
+        )
+
     @classmethod
     def interpolate(cls, start: Self, end: Self, progress: float):
         return PathStyle(
@@ -588,6 +644,50 @@ class PathStyle(AnimatableProperty):
     def __repr__(self) -> str:
         return f"PathStyle({self.color}, {self.thickness}, {self.anti_alias}, {self._stroke}, {self._stroke_cap})"
 
+    def _key(self) -> Tuple:
+        return (
+            self._color,
+            self._thickness,
+            self._anti_alias,
+            self._stroke,
+            self._stroke_cap,
+            self._dashed,
+            tuple(self._dash_intervals),
+            self._dash_phase,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PathStyle):
+            return NotImplemented
+
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+
+@functools.lru_cache(maxsize=256)
+def _shared_path_style(
+    color: Color,
+    thickness: float,
+    anti_alias: bool,
+    stroke: bool,
+    stroke_cap: StrokeCap,
+    dashed: bool,
+    dash_intervals: Tuple[float, ...],
+    dash_phase: float,
+) -> PathStyle:
+    return PathStyle(
+        color,
+        thickness,
+        anti_alias,
+        stroke,
+        stroke_cap,
+        dashed,
+        list(dash_intervals),
+        dash_phase,
+    )
+
 
 @dataclass
 class FontStyle(object):
@@ -620,17 +720,29 @@ class FontStyle(object):
         )
 
     def get_skia_font(self) -> skia.Font:
-        if self.filename is not None:
-            return skia.Font(
-                skia.Typeface.MakeFromFile(self.filename),
-                self.size,
-            )
-
         return skia.Font(
-            skia.Typeface(self.family, self.font_style.value),
+            _load_typeface(self.family, self.filename, self.font_style),
             self.size,
         )
 
     @staticmethod
     def available_fonts() -> List[str]:
-        return list(skia.FontMgr())
+        return list(_available_font_families())
+
+
+@functools.lru_cache(maxsize=None)
+def _available_font_families() -> Tuple[str, ...]:
+    return tuple(skia.FontMgr())
+
+
+@functools.lru_cache(maxsize=256)
+def _load_typeface(
+    family: Optional[str], filename: Optional[str], font_style: FontStyle.Style
+) -> skia.Typeface:
+    """Loads a typeface, caching it so text that is rebuilt every frame does not
+    hit the font manager or the filesystem each time."""
+
+    if filename is not None:
+        return skia.Typeface.MakeFromFile(filename)
+
+    return skia.Typeface(family, font_style.value)
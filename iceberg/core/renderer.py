@@ -1,7 +1,7 @@
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 from .drawable import Drawable
-from .properties import Color
+from .properties import Bounds, Color
 
 import skia
 import glfw
@@ -11,6 +11,37 @@ import os
 import numpy as np
 
 
+# The GL context is created once and shared by every GPU surface, so resizing a
+# renderer does not spin up a new window and context.
+_gl_window = None
+_gl_context = None
+
+
+def _get_gl_context() -> skia.GrDirectContext:
+    """Returns the shared Skia GL context, creating it on first use.
+
+    Returns:
+        A GrDirectContext bound to a hidden GLFW window.
+    """
+
+    global _gl_window, _gl_context
+
+    if _gl_context is None:
+        if not glfw.init():
+            raise RuntimeError("glfw.init() failed")
+
+        glfw.window_hint(glfw.VISIBLE, glfw.FALSE)
+        glfw.window_hint(glfw.STENCIL_BITS, 8)
+        _gl_window = glfw.create_window(1, 1, "", None, None)
+        glfw.make_context_current(_gl_window)
+
+        _gl_context = skia.GrDirectContext.MakeGL()
+        if _gl_context is None:
+            raise RuntimeError("Could not create a Skia GL context.")
+
+    return _gl_context
+
+
 def get_skia_surface(width, height):
     """Creates a Skia surface for rendering to on the GPU.
 
@@ -22,37 +53,93 @@ def get_skia_surface(width, height):
         A SkSurface with the given dimensions.
     """
 
-    if not glfw.init():
-        raise RuntimeError("glfw.init() failed")
+    context = _get_gl_context()
 
     # Round up width and height to the nearest integer.
     width = int(width + 0.5)
     height = int(height + 0.5)
 
-    glfw.window_hint(glfw.VISIBLE, glfw.FALSE)
-    glfw.window_hint(glfw.STENCIL_BITS, 8)
-    window = glfw.create_window(width, height, "", None, None)
-    glfw.make_context_current(window)
-
-    context = skia.GrDirectContext.MakeGL()
     info = skia.ImageInfo.MakeN32Premul(width, height)
     surface = skia.Surface.MakeRenderTarget(context, skia.Budgeted.kNo, info)
 
     return surface
 
 
-def _canvas_draw_commands(canvas, drawable: Drawable, background_color: Color = None):
+def _canvas_draw_commands(
+    canvas,
+    drawable: Drawable,
+    background_color: Color = None,
+    viewport: Optional[Bounds] = None,
+):
+    if viewport is None:
+        viewport = drawable.bounds
+
     if background_color is not None:
         canvas.clear(background_color.to_skia())
     else:
         canvas.clear(skia.Color4f(0, 0, 0, 0))
 
     canvas.save()
-    canvas.translate(-drawable.bounds.left, -drawable.bounds.top)
+    canvas.translate(-viewport.left, -viewport.top)
     drawable.draw(canvas)
     canvas.restore()
 
 
+def record_picture(
+    drawable: Drawable,
+    background_color: Color = None,
+    viewport: Optional[Bounds] = None,
+) -> bytes:
+    """Records the draw commands of a Drawable into a serialized Skia picture.
+
+    Recording captures the state of the Drawable at the time of the call, so time
+    dependent Drawables can be advanced afterwards without affecting the picture.
+
+    Args:
+        drawable: The Drawable to record.
+        background_color: The background color to use. If None, the background will be transparent.
+        viewport: The area of the Drawable to record. If None, its bounds are used.
+
+    Returns:
+        The serialized picture, to be rasterized with `rasterize_picture`.
+    """
+
+    if viewport is None:
+        viewport = drawable.bounds
+
+    recorder = skia.PictureRecorder()
+    canvas = recorder.beginRecording(skia.Rect.MakeWH(viewport.width, viewport.height))
+    _canvas_draw_commands(canvas, drawable, background_color, viewport)
+    picture = recorder.finishRecordingAsPicture()
+
+    return picture.serialize().bytes()
+
+
+def rasterize_picture(picture_data: bytes, width: int, height: int) -> np.ndarray:
+    """Rasterizes a picture produced by `record_picture` on the CPU.
+
+    This only depends on its arguments, so it can run in a worker process.
+
+    Args:
+        picture_data: The serialized picture.
+        width: The width of the image in pixels.
+        height: The height of the image in pixels.
+
+    Returns:
+        The rendered image as a numpy array.
+    """
+
+    picture = skia.Picture.MakeFromData(skia.Data.MakeWithCopy(picture_data))
+    surface = skia.Surface(width, height)
+
+    with surface as canvas:
+        canvas.clear(skia.Color4f(0, 0, 0, 0))
+        canvas.drawPicture(picture)
+
+    image = surface.makeImageSnapshot()
+    return image.toarray(colorType=skia.ColorType.kRGBA_8888_ColorType)
+
+
 class Renderer(object):
     def __init__(self, gpu: bool = False, skia_surface=None):
         """Creates a new Renderer.
@@ -74,16 +161,34 @@ class Renderer(object):
         self._bounds = None
         self._drawable = None
 
-    def _try_create_skia_surface(self, drawable: Drawable):
+        # The pixel size of the current surface. Surfaces only depend on the size of
+        # what is drawn, so they are reused as long as the size does not change.
+        self._surface_size = None
+        if skia_surface is not None:
+            self._surface_size = (skia_surface.width(), skia_surface.height())
+
+    def _try_create_skia_surface(self, drawable: Drawable, viewport: Bounds = None):
         self._drawable = drawable
-        if self._skia_surface is None or self._bounds != drawable.bounds:
-            self._bounds = drawable.bounds
+        self._bounds = drawable.bounds if viewport is None else viewport
+
+        surface_size = (
+            int(self._bounds.width + 0.5),
+            int(self._bounds.height + 0.5),
+        )
+
+        if self._skia_surface is None or self._surface_size != surface_size:
+            self._surface_size = surface_size
             if self._gpu:
                 self._skia_surface = self._create_gpu_surface()
             else:
                 self._skia_surface = self._create_cpu_surface()
 
-    def render(self, drawable: Drawable, background_color: Color = None):
+    def render(
+        self,
+        drawable: Drawable,
+        background_color: Color = None,
+        viewport: Optional[Bounds] = None,
+    ):
         """Renders the given Drawable to the surface.
 
         Note that calling this again and again with a differently sized Drawable will
@@ -97,25 +202,54 @@ class Renderer(object):
         Args:
             drawable: The Drawable to render.
             background_color: The background color to use. If None, the background will be transparent.
+            viewport: The area of the Drawable to render, which sets the size of the
+                image. If None, the bounds of the Drawable are used. Rendering a fixed
+                viewport is cheaper than cropping the Drawable to it.
         """
 
-        self._try_create_skia_surface(drawable)
+        self._try_create_skia_surface(drawable, viewport)
 
         with self._skia_surface as canvas:
-            _canvas_draw_commands(canvas, drawable, background_color)
+            _canvas_draw_commands(canvas, drawable, background_color, viewport)
 
-    def get_rendered_image(self) -> np.ndarray:
+    def get_rendered_image(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """Returns the rendered image as a numpy array.
 
+        Args:
+            out: An optional C-contiguous (height, width, 4) uint8 array to read the
+                image into, e.g. to reuse one buffer for every frame of an animation
+                instead of allocating a new image each time.
+
         Returns:
-            The rendered image as a numpy array.
+            The rendered image as a numpy array, `out` if it was given.
+
+        Raises:
+            RuntimeError: If the pixels could not be read into `out`.
         """
 
-        # TODO(revalo): Convert BGR to RGB via Skia.
-        image = self._skia_surface.makeImageSnapshot()
-        array = image.toarray(colorType=skia.ColorType.kRGBA_8888_ColorType)
+        if out is None:
+            # TODO(revalo): Convert BGR to RGB via Skia.
+            image = self._skia_surface.makeImageSnapshot()
+            array = image.toarray(colorType=skia.ColorType.kRGBA_8888_ColorType)
+
+            return array
+
+        width, height = self._skia_surface.width(), self._skia_surface.height()
+        assert out.shape == (height, width, 4), "out must match the surface size."
+        assert out.dtype == np.uint8 and out.flags.c_contiguous
+
+        # Reading the pixels directly also avoids the snapshot, which would make the
+        # surface copy its pixels before the next frame is drawn.
+        image_info = skia.ImageInfo.Make(
+            width,
+            height,
+            skia.ColorType.kRGBA_8888_ColorType,
+            skia.AlphaType.kUnpremul_AlphaType,
+        )
+        if not self._skia_surface.readPixels(image_info, out, out.strides[0]):
+            raise RuntimeError("Could not read the rendered pixels.")
 
-        return array
+        return out
 
     def save_rendered_image(self, path: Union[str, Path]):
         """Saves the rendered image to the given path.
@@ -143,13 +277,36 @@ class Renderer(object):
         )
 
 
-def _svg_postprocess(svg: str) -> str:
+# A number in SVG path data, possibly in scientific notation.
+_SVG_NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+
+def _round_svg_path_data(path_data: str, precision: int) -> str:
+    def _round(match: re.Match) -> str:
+        rounded = f"{float(match.group()):.{precision}f}"
+        if "." in rounded:
+            rounded = rounded.rstrip("0").rstrip(".")
+        return "0" if rounded == "-0" else rounded
+
+    return _SVG_NUMBER.sub(_round, path_data)
+
+
+def _svg_postprocess(svg: str, precision: Optional[int] = None) -> str:
     # Skia adds a trailing comma to `y="0"`, which is invalid SVG.
     # While Chrome can render it, Firefox cannot.
 
     # Replace `y="<number>, "` with `y="<number>"`.
     svg = re.sub(r'y="(\d+\.?\d*), "', r'y="\1"', svg)
 
+    # Path data is most of the file for drawings with many paths, and Skia writes it
+    # with full float precision.
+    if precision is not None:
+        svg = re.sub(
+            r'\bd="([^"]*)"',
+            lambda match: f'd="{_round_svg_path_data(match.group(1), precision)}"',
+            svg,
+        )
+
     return svg
 
 
@@ -158,7 +315,19 @@ def render_svg(
     filename: str,
     background_color: Color = None,
     run_postprocess: bool = True,
+    precision: Optional[int] = None,
 ):
+    """Render a drawable to an SVG file.
+
+    Args:
+        drawable: The drawable to render.
+        filename: The filename to write to, must end in `.svg`.
+        background_color: The background color, if any.
+        run_postprocess: Whether to fix up Skia's SVG output for other viewers.
+        precision: If set, the number of decimals to round path coordinates to, which
+            makes the file smaller. Only applies when `run_postprocess` is True.
+    """
+
     assert filename.endswith(".svg")
 
     stream = skia.FILEWStream(filename)
@@ -174,6 +343,6 @@ def render_svg(
     if run_postprocess:
         with open(filename, "r") as f:
             svg = f.read()
-        svg = _svg_postprocess(svg)
+        svg = _svg_postprocess(svg, precision)
         with open(filename, "w") as f:
             f.write(svg)
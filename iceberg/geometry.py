@@ -113,12 +113,11 @@ def apply_transform(
     Returns:
         The transformed points.
     """
-    return [
-        tuple(
-            np.matmul(
-                transform,
-                np.array([x, y, 1]),
-            )[:2]
-        )
-        for x, y in points
-    ]
+    if len(points) == 0:
+        return []
+
+    # Transform all the points with a single matrix product instead of one per point.
+    homogeneous = np.ones((len(points), 3))
+    homogeneous[:, :2] = points
+
+    return [tuple(point) for point in (homogeneous @ transform.T)[:, :2]]
@@ -2,6 +2,7 @@ from .shapes import (
     Rectangle,
     Ellipse,
     Line,
+    LineBatch,
     BorderPosition,
     Path,
     CurvedCubicLine,
@@ -25,7 +26,7 @@ from .text import SimpleText, Text
 from .svg import SVG, SVGPath
 from .latex import Tex, MathTex, Brace
 from .typst import Typst, MathTypst
-from .filters import Blur, Opacity
+from .filters import Blur, Opacity, Cached
 from .image import Image
 from .splines import SmoothPath, CubicBezier
 
@@ -38,6 +39,7 @@ __all__ = [
     "Rectangle",
     "Ellipse",
     "Line",
+    "LineBatch",
     "BorderPosition",
     "Path",
     "CurvedCubicLine",
@@ -62,6 +64,7 @@ __all__ = [
     "MathTypst",
     "Blur",
     "Opacity",
+    "Cached",
     "Image",
     "SmoothPath",
     "MatplotlibFigure",
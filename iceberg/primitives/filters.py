@@ -78,6 +78,46 @@ class Opacity(Filter):
         self.set_paint(self.child, paint)
 
 
+class Cached(Drawable):
+    """Draw the child from a picture recorded once.
+
+    Replaying the picture skips walking the child's scene graph on every draw, which
+    helps for large static parts of a scene that are drawn again every frame, like
+    backgrounds. The picture is clipped to the child's bounds, and drawing it is
+    skipped entirely when those bounds are outside the canvas clip. The child is only
+    drawn once, so it must not change afterwards, e.g. by being animated.
+
+    Args:
+        child: The child to cache.
+    """
+
+    child: Drawable
+
+    def setup(self):
+        self._cull_rect = self.child.bounds.to_skia()
+
+        picture_recorder = skia.PictureRecorder()
+        fake_canvas = picture_recorder.beginRecording(self._cull_rect)
+        fake_canvas.clipRect(self._cull_rect)
+
+        self.child.draw(fake_canvas)
+        self._skia_picture = picture_recorder.finishRecordingAsPicture()
+
+    @property
+    def children(self) -> Sequence[Drawable]:
+        return [self.child]
+
+    @property
+    def bounds(self) -> Bounds:
+        return self.child.bounds
+
+    def draw(self, canvas: skia.Canvas) -> None:
+        if canvas.quickReject(self._cull_rect):
+            return
+
+        canvas.drawPicture(self._skia_picture)
+
+
 class Hidden(DrawableWithChild):
     """Hide the child.
 
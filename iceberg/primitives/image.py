@@ -63,21 +63,29 @@ class Image(Drawable):
                 # grayscale image, add channel
                 image = image[..., np.newaxis]
 
-            if image.shape[-1] == 1:
-                # grayscale image, copy channels
-                image = np.repeat(image, 3, axis=-1)
-
-            if image.shape[-1] == 3:
-                # Add alpha channel
-                image = np.concatenate([image, np.ones_like(image[..., :1])], axis=-1)
+            assert image.shape[-1] in {
+                1,
+                3,
+                4,
+            }, f"Invalid image shape: {image.shape}, must have 1, 3 or 4 channels."
 
             if not np.issubdtype(image.dtype, np.integer):
                 assert np.all(image >= 0) and np.all(image <= 1)
                 image = image * 255
-            image = image.astype(np.uint8)
+
+            # Fill a single RGBA buffer in place, rather than making a new array for
+            # every channel added and every conversion.
+            rgba = np.empty(image.shape[:2] + (4,), dtype=np.uint8)
+
+            if image.shape[-1] == 4:
+                rgba[...] = image
+            else:
+                # Grayscale images are broadcast to all three color channels.
+                rgba[..., :3] = image
+                rgba[..., 3] = 255
 
             self._skia_image = skia.Image.fromarray(
-                image, colorType=skia.ColorType.kRGBA_8888_ColorType
+                rgba, colorType=skia.ColorType.kRGBA_8888_ColorType
             )
 
         self._paint = skia.Paint(
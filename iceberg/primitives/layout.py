@@ -49,7 +49,27 @@ class Blank(Drawable):
         return self.rectangle
 
     def draw(self, canvas: skia.Canvas) -> None:
-        canvas.drawRect(self.rectangle.to_skia(), self._paint)
+        rect = self.rectangle.to_skia()
+
+        # An opaque blank that covers everything that can be drawn to (typically the
+        # background of a frame) is just a clear, which skips anti-aliasing and
+        # blending entirely.
+        matrix = canvas.getTotalMatrix()
+        if (
+            self.background_color.a == 1
+            and matrix.rectStaysRect()
+            and matrix.mapRect(rect).contains(
+                skia.Rect.Make(canvas.getDeviceClipBounds())
+            )
+        ):
+            # Clip anyway, so recorded pictures replayed elsewhere stay in bounds.
+            canvas.save()
+            canvas.clipRect(rect)
+            canvas.clear(self.background_color.to_skia())
+            canvas.restore()
+            return
+
+        canvas.drawRect(rect, self._paint)
 
     @classmethod
     def from_size(
@@ -82,11 +102,13 @@ class Compose(Drawable):
         self._composed_bounds = Bounds.empty()
 
         if len(self.components):
-            # Compute the bounds of the composed children.
-            left = min([child.bounds.left for child in self.children])
-            top = min([child.bounds.top for child in self.children])
-            right = max([child.bounds.right for child in self.children])
-            bottom = max([child.bounds.bottom for child in self.children])
+            # Compute the bounds of the composed children. The bounds of a child may be
+            # computed on access, e.g. for animations, so each is only read once.
+            child_bounds = [child.bounds for child in self.children]
+            left = min([bounds.left for bounds in child_bounds])
+            top = min([bounds.top for bounds in child_bounds])
+            right = max([bounds.right for bounds in child_bounds])
+            bottom = max([bounds.bottom for bounds in child_bounds])
 
             self._composed_bounds = Bounds(
                 left=left,
@@ -463,6 +485,28 @@ class Arrange(DrawableWithChild):
 
         self.set_child(arrangement)
 
+        # Transforms to children that were found, keyed on their id. The found children
+        # are kept alive by this arrangement, so their ids cannot be reused.
+        self._child_transforms = {}
+
+    def child_transform(self, search_child: Drawable) -> np.ndarray:
+        """Get the transformation matrix from this drawable to the specified child.
+
+        Arrangements chain `next_to` once per child, so finding a child walks a deep
+        tree. The result is cached, which makes repeated lookups, e.g. for connecting
+        lines between arranged nodes, cheap. The returned matrix is read-only.
+        """
+
+        key = id(search_child)
+        transform = self._child_transforms.get(key)
+
+        if transform is None:
+            transform = super().child_transform(search_child)
+            transform.setflags(write=False)
+            self._child_transforms[key] = transform
+
+        return transform
+
 
 class Grid(DrawableWithChild):
     """A drawable that arranges its children in a grid.
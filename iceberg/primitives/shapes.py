@@ -1,8 +1,9 @@
 import math
 from abc import ABC
 from enum import Enum
-from typing import List, Sequence, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 import skia
 
 from iceberg import (
@@ -156,35 +157,53 @@ class Ellipse(Rectangle):
 class Path(Drawable, ABC):
     """Base class for paths."""
 
-    def set_path(self, skia_path: skia.Path, path_style: PathStyle):
+    def set_path(
+        self,
+        skia_path: skia.Path,
+        path_style: PathStyle,
+        fill_style: Optional[PathStyle] = None,
+    ):
         """Set the path and path style from the setup of a derived class.
 
         Args:
             skia_path: The path to set.
             path_style: The path style to set.
+            fill_style: An optional style to fill the path with before drawing it with
+                the path style. The bounds are those of the path style.
         """
 
         self._skia_path = skia_path
         self._path_style = path_style
+        self._fill_style = fill_style
+
+        # Measuring is only needed for partial paths and arrows, so do it lazily.
+        self._path_measure = None
+        self._length = None
 
         self._fill_path = skia.Path()
         self._path_style.skia_paint.getFillPath(self._skia_path, self._fill_path)
         self._bounds = Bounds.from_skia(self._fill_path.computeTightBounds())
 
     @classmethod
-    def from_skia(cls, skia_path: skia.Path, path_style: PathStyle):
+    def from_skia(
+        cls,
+        skia_path: skia.Path,
+        path_style: PathStyle,
+        fill_style: Optional[PathStyle] = None,
+    ):
         """Initialize a standalone path from a Skia path and path style.
 
         Args:
             skia_path: The Skia path.
             path_style: The path style.
+            fill_style: An optional style to fill the path with underneath.
 
         Returns:
             The path.
         """
 
         path = cls()
-        path.set_path(skia_path, path_style)
+        path.set_path(skia_path, path_style, fill_style)
         return path
 
     @property
@@ -192,11 +211,34 @@ class Path(Drawable, ABC):
         """The Skia path."""
         return self._skia_path
 
+    @property
+    def path_measure(self) -> skia.PathMeasure:
+        """A measure of the Skia path, created on first use.
+
+        The measure is shared by everything that measures this path, so it must not be
+        advanced to the next contour.
+        """
+        if self._path_measure is None:
+            self._path_measure = skia.PathMeasure(self._skia_path, False)
+
+        return self._path_measure
+
+    @property
+    def length(self) -> float:
+        """The length of the path."""
+        if self._length is None:
+            self._length = self.path_measure.getLength()
+
+        return self._length
+
     @property
     def bounds(self) -> Bounds:
         return self._bounds
 
     def draw(self, canvas):
+        if self._fill_style is not None:
+            canvas.drawPath(self._skia_path, self._fill_style.skia_paint)
+
         canvas.drawPath(self._skia_path, self._path_style.skia_paint)
 
 
@@ -251,30 +293,46 @@ class PartialPath(Drawable):
         self._subdivide_increment = self.subdivide_increment
         self._interpolation = self.interpolation
 
-        self._path_measure = skia.PathMeasure(self._child_path.skia_path, False)
-        self._total_length = self._path_measure.getLength()
+        self._path_measure = self._child_path.path_measure
+        self._total_length = self._child_path.length
 
-        self._points = []
-        self._tangents = []
-
-        # Subdivide the path and store the points and tangents.
-        current_t = self.start
-
-        while current_t < self.end:
-            current_distance = self._total_length * current_t
-
-            point, tangent = self._path_measure.getPosTan(current_distance)
-
-            self._points.append(point)
-            self._tangents.append(tangent)
-
-            current_t += self.subdivide_increment
+        # Subdivide the path and store the points and tangents, including the end
+        # point. The sample distances are computed in one go rather than by
+        # accumulating the increment.
+        sample_ts = np.append(
+            np.arange(self.start, self.end, self.subdivide_increment), self.end
+        )
 
-        # Add the end point.
-        point, tangent = self._path_measure.getPosTan(self._total_length * self.end)
+        if isinstance(self._child_path, Line) and self._total_length > 0:
+            # Points on a straight line can be found directly, and any interpolation
+            # through them is the line itself, so it is drawn as a single segment.
+            start_x, start_y = self._child_path.start
+            end_x, end_y = self._child_path.end
+            dx, dy = end_x - start_x, end_y - start_y
+
+            # Clamp to the line like the path measure clamps distances to the path.
+            line_ts = np.clip(sample_ts, 0, 1).tolist()
+            self._points = [
+                skia.Point(start_x + dx * t, start_y + dy * t) for t in line_ts
+            ]
+
+            # Every sample gets its own tangent, as they are mutable.
+            tangent_x, tangent_y = dx / self._total_length, dy / self._total_length
+            self._tangents = [skia.Point(tangent_x, tangent_y) for _ in line_ts]
+
+            self._partial_path = skia.Path()
+            self._partial_path.moveTo(self._points[0])
+            if len(self._points) > 1:
+                self._partial_path.lineTo(self._points[-1])
+            return
+
+        samples = [
+            self._path_measure.getPosTan(distance)
+            for distance in (self._total_length * sample_ts).tolist()
+        ]
 
-        self._points.append(point)
-        self._tangents.append(tangent)
+        self._points = [point for point, _ in samples]
+        self._tangents = [tangent for _, tangent in samples]
 
         self._partial_path = skia.Path()
         self._partial_path.moveTo(self._points[0])
@@ -285,30 +343,40 @@ class PartialPath(Drawable):
         elif self.interpolation == self.Interpolation.CUBIC:
             segment_length = self._total_length * self.subdivide_increment
 
-            for point, tangent, next_point, next_tangent in zip(
-                self._points[:-1],
-                self._tangents[:-1],
-                self._points[1:],
-                self._tangents[1:],
+            points = np.array([(point.x(), point.y()) for point in self._points])
+
+            # The tangents are unit vectors, but we would like actual time
+            # derivatives for the conversion below. That's an underspecified
+            # problem (the original path may not even have a notion of time.
+            # But by scaling with the segment length we at least get
+            # a reasonable choice (in particular, this makes the shape of the
+            # interpolation invariant to scaling the entire path).
+            tangents = (
+                np.array([(tangent.x(), tangent.y()) for tangent in self._tangents])
+                * segment_length
+            )
+
+            # Compute control points (i.e. convert from Hermite to Bezier curve):
+            control_points_1 = points[:-1] + tangents[:-1] * 0.333
+            control_points_2 = points[1:] - tangents[1:] * 0.333
+
+            for p1, p2, next_point in zip(
+                control_points_1.tolist(),
+                control_points_2.tolist(),
+                points[1:].tolist(),
             ):
-                # The tangents are unit vectors, but we would like actual time
-                # derivatives for the conversion below. That's an underspecified
-                # problem (the original path may not even have a notion of time.
-                # But by scaling with the segment length we at least get
-                # a reasonable choice (in particular, this makes the shape of the
-                # interpolation invariant to scaling the entire path).
-                tangent = tangent * segment_length
-                next_tangent = next_tangent * segment_length
-                # Compute control points (i.e. convert from Hermite to Bezier curve):
-                p1 = point + tangent * 0.333
-                p2 = next_point - next_tangent * 0.333
-                self._partial_path.cubicTo(p1, p2, next_point)
+                self._partial_path.cubicTo(*p1, *p2, *next_point)
         else:
             raise ValueError(f"Unknown interpolation {self.interpolation}.")
 
     def draw(self, canvas: skia.Canvas):
         canvas.drawPath(self._partial_path, self._child_path._path_style.skia_paint)
 
+    @property
+    def skia_path(self) -> skia.Path:
+        """The Skia path of the part of the path that is drawn."""
+        return self._partial_path
+
     @property
     def tangents(self) -> Sequence[skia.Point]:
         return self._tangents
@@ -329,6 +397,26 @@ class PartialPath(Drawable):
     def total_length(self) -> float:
         return self._total_length
 
+    def point_and_tangent_at(
+        self, t: float
+    ) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """Get the point and unit tangent at a fraction of the partial path.
+
+        The lookup goes straight to the path measure built in setup, so it does not
+        depend on how finely the path was subdivided.
+
+        Args:
+            t: The fraction along the partial path, between 0 and 1.
+
+        Returns:
+            The point and the tangent at t.
+        """
+
+        distance = self._total_length * (self._start + t * (self._end - self._start))
+        point, tangent = self._path_measure.getPosTan(distance)
+
+        return tuple(point), tuple(tangent)
+
 
 class Line(Path):
     """A line.
@@ -359,6 +447,48 @@ class Line(Path):
         self.set_path(path, self.path_style)
 
 
+class LineBatch(Path):
+    """Many straight lines sharing a single path style, drawn as one path.
+
+    This is much cheaper than a `Line` per segment when drawing hundreds of lines,
+    since there is a single drawable and a single draw call. Unlike separate lines,
+    overlapping lines with a translucent color are blended only once.
+
+    Args:
+        starts: The start points of the lines, as an (N, 2) array.
+        ends: The end points of the lines, as an (N, 2) array.
+        path_style: The path style.
+
+    Raises:
+        AssertionError: If starts and ends do not have the same (N, 2) shape.
+    """
+
+    starts: np.ndarray
+    ends: np.ndarray
+    path_style: PathStyle
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        path_style: PathStyle,
+    ):
+        self.init_from_fields(starts=starts, ends=ends, path_style=path_style)
+
+    def setup(self):
+        starts = np.asarray(self.starts, dtype=float).reshape(-1, 2)
+        ends = np.asarray(self.ends, dtype=float).reshape(-1, 2)
+
+        assert starts.shape == ends.shape, "Every line needs a start and an end."
+
+        path = skia.Path()
+        for (start_x, start_y), (end_x, end_y) in zip(starts.tolist(), ends.tolist()):
+            path.moveTo(start_x, start_y)
+            path.lineTo(end_x, end_y)
+
+        self.set_path(path, self.path_style)
+
+
 class CurvedCubicLine(Path):
     """A cubic line with curved edges.
 
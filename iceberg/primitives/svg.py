@@ -1,11 +1,50 @@
-import skia
+import functools
 import hashlib
 import os
+from typing import Tuple
+
+import skia
 
 from iceberg import Drawable, Bounds, Color, Colors, PathStyle
 from iceberg.utils import temp_directory
 
 
+@functools.lru_cache(maxsize=256)
+def _load_svg_picture(
+    svg_filename: str, mtime: float
+) -> Tuple[skia.Picture, float, float]:
+    """Parses an SVG file and records it into a picture.
+
+    Results are cached, so SVGs that are created over and over again (e.g. a Tex
+    drawable rebuilt every frame) are only parsed once. The modification time is
+    part of the cache key so edited files are picked up.
+
+    Args:
+        svg_filename: The filename of the SVG file to load.
+        mtime: The modification time of the file.
+
+    Returns:
+        The recorded picture and its width and height.
+    """
+
+    skia_stream = skia.FILEStream.Make(svg_filename)
+    skia_svg = skia.SVGDOM.MakeFromStream(skia_stream)
+
+    container_size = skia_svg.containerSize()
+
+    if container_size.isEmpty():
+        container_size = skia.Size(100, 100)
+        skia_svg.setContainerSize(container_size)
+
+    width, height = container_size.width(), container_size.height()
+
+    picture_recorder = skia.PictureRecorder()
+    fake_canvas = picture_recorder.beginRecording(width, height)
+    skia_svg.render(fake_canvas)
+
+    return picture_recorder.finishRecordingAsPicture(), width, height
+
+
 class SVG(Drawable):
     """Initialize the SVG drawable.
 
@@ -45,28 +84,16 @@ class SVG(Drawable):
                 )
             )
 
-        skia_stream = skia.FILEStream.Make(self._svg_filename)
-        self._skia_svg = skia.SVGDOM.MakeFromStream(skia_stream)
-
-        container_size = self._skia_svg.containerSize()
-
-        if container_size.isEmpty():
-            container_size = skia.Size(100, 100)
-            self._skia_svg.setContainerSize(container_size)
+        self._skia_picture, width, height = _load_svg_picture(
+            self._svg_filename, os.path.getmtime(self._svg_filename)
+        )
 
         self._bounds = Bounds(
             left=0,
             top=0,
-            right=container_size.width(),
-            bottom=container_size.height(),
-        )
-
-        picture_recorder = skia.PictureRecorder()
-        fake_canvas = picture_recorder.beginRecording(
-            self._bounds.width, self._bounds.height
+            right=width,
+            bottom=height,
         )
-        self._skia_svg.render(fake_canvas)
-        self._skia_picture = picture_recorder.finishRecordingAsPicture()
 
         super().__init__()
 
@@ -4,6 +4,10 @@ from .test_neural_net import NeuralNetwork
 
 import os
 
+import av
+import numpy as np
+from PIL import Image, ImageSequence
+
 
 def test_logo_float():
     class Anim(ice.Scene):
@@ -260,3 +264,90 @@ def test_animation_within_animation():
             self.play(background + square)
 
     check_animation(Anim().combined_scene, "animation_within_animation")
+
+
+def test_ease_batch():
+    xs = np.linspace(0, 1, 101)
+
+    for ease_type in [
+        ice.EaseType.LINEAR,
+        ice.EaseType.EASE_IN_OUT_QUAD,
+        ice.EaseType.EASE_OUT_CUBIC,
+        ice.EaseType.EASE_IN_OUT_SINE,
+    ]:
+        expected = [ease_type(x) for x in xs.tolist()]
+        np.testing.assert_allclose(ice.ease_batch(ease_type, xs), expected, atol=1e-5)
+
+
+def test_ease_in_out_expo():
+    ease = ice.EaseType.EASE_IN_OUT_EXPO
+
+    # Both halves meet at the midpoint.
+    assert abs(ease(0.5 - 1e-9) - 0.5) < 1e-6
+    assert abs(ease(0.5) - 0.5) < 1e-6
+
+    assert abs(ease(0.0)) < 1e-3
+    assert abs(ease(1.0) - 1) < 1e-3
+
+
+def _moving_square_scene(duration: float) -> ice.Scene:
+    def make_frame(t: float) -> ice.Drawable:
+        blank = ice.Blank(ice.Bounds.from_size(64, 64), ice.Colors.WHITE)
+        square = ice.Rectangle(ice.Bounds.from_size(16, 16), fill_color=ice.Colors.BLUE)
+        square = square.move(t * 100, 20)
+        return ice.Compose([blank, square])
+
+    return ice.Scene(duration, make_frame)
+
+
+def _gif_frames(filename: str):
+    with Image.open(filename) as image:
+        return [
+            np.array(frame.convert("RGBA")) for frame in ImageSequence.Iterator(image)
+        ]
+
+
+def _video_frames(filename: str):
+    with av.open(filename) as container:
+        return [frame.to_ndarray(format="rgb24") for frame in container.decode(video=0)]
+
+
+def test_render_gif_with_workers(tmp_path):
+    scene = _moving_square_scene(0.4)
+    single_filename = str(tmp_path / "single.gif")
+    workers_filename = str(tmp_path / "workers.gif")
+
+    scene.render(single_filename, fps=25, progress_bar=False)
+    scene.render(workers_filename, fps=25, progress_bar=False, num_workers=2)
+
+    single_frames = _gif_frames(single_filename)
+    workers_frames = _gif_frames(workers_filename)
+
+    assert len(single_frames) == len(workers_frames) > 1
+    for single_frame, workers_frame in zip(single_frames, workers_frames):
+        np.testing.assert_array_equal(single_frame, workers_frame)
+
+
+def test_render_video_with_workers_and_codec_fallback(tmp_path):
+    scene = _moving_square_scene(0.4)
+    single_filename = str(tmp_path / "single.mp4")
+    workers_filename = str(tmp_path / "workers.mp4")
+
+    scene.render(single_filename, fps=30, progress_bar=False)
+    # An encoder that does not exist falls back to libx264.
+    scene.render(
+        workers_filename,
+        fps=30,
+        progress_bar=False,
+        num_workers=2,
+        codec="not_a_real_encoder",
+        codec_options={"preset": "veryfast"},
+    )
+
+    single_frames = _video_frames(single_filename)
+    workers_frames = _video_frames(workers_filename)
+
+    assert len(single_frames) == len(workers_frames) == 12
+    for single_frame, workers_frame in zip(single_frames, workers_frames):
+        difference = np.abs(single_frame.astype(float) - workers_frame.astype(float))
+        assert difference.mean() < 2
@@ -1,6 +1,9 @@
 import iceberg as ice
+from iceberg.arrows.helpers import arrow_corners, arrow_corners_batch
 from .scene_tester import check_render
 
+import numpy as np
+
 
 def test_arrow_path():
     s = 256
@@ -13,3 +16,15 @@ def test_arrow_path():
     scene = blank.add(arrow_path)
 
     check_render(scene, "smooth_arrow_path.png")
+
+
+def test_arrow_corners_batch():
+    starts = np.array([(0, 0), (10, 20), (-5, 3)])
+    ends = np.array([(10, 0), (10, -20), (7, 11)])
+
+    corners1, corners2 = arrow_corners_batch(starts, ends, 30, 20)
+
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        corner1, corner2 = arrow_corners(start, end, 30, 20)
+        assert np.allclose(corners1[i], corner1)
+        assert np.allclose(corners2[i], corner2)
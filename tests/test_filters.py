@@ -3,6 +3,7 @@ from .scene_tester import check_render
 
 import os
 import numpy as np
+import pytest
 
 
 def test_image():
@@ -21,6 +22,23 @@ def test_np_image():
     check_render(scene, "np_image.png")
 
 
+def test_np_image_integer_rgb_is_opaque():
+    array = np.zeros((32, 32, 3), dtype=np.uint8)
+    array[:, :16] = (255, 0, 0)
+
+    renderer = ice.Renderer()
+    renderer.render(ice.Image(image=array))
+    rendered = renderer.get_rendered_image()
+
+    assert np.all(rendered[..., 3] == 255)
+    assert np.all(rendered[:, :16, :3] == (255, 0, 0))
+
+
+def test_np_image_invalid_channels():
+    with pytest.raises(AssertionError):
+        ice.Image(image=np.zeros((32, 32, 2), dtype=np.uint8))
+
+
 def test_blurred_image():
     blank = ice.Blank(ice.Bounds.from_size(512, 512), ice.Colors.GREEN)
     image = ice.Blur(
@@ -42,3 +60,34 @@ def test_opacity():
     )
     scene = blank.add_centered(image).add_centered(line)
     check_render(scene, "opacity_image.png")
+
+
+def test_cached():
+    blank = ice.Blank(ice.Bounds.from_size(512, 512), ice.Colors.GREEN)
+    image = ice.Image(filename=os.path.join("tests", "testdata", "logo.png"))
+    scene = ice.Cached(child=blank.add_centered(image))
+    check_render(scene, "image.png")
+
+
+def test_cached_draws_child_once():
+    draw_count = 0
+
+    class CountingRectangle(ice.Rectangle):
+        def draw(self, canvas):
+            nonlocal draw_count
+            draw_count += 1
+            super().draw(canvas)
+
+    scene = ice.Cached(
+        child=CountingRectangle(
+            rectangle=ice.Bounds.from_size(64, 64), fill_color=ice.Colors.GREEN
+        )
+    )
+    assert draw_count == 1
+
+    renderer = ice.Renderer()
+    for _ in range(3):
+        renderer.render(scene)
+
+    assert draw_count == 1
+    assert tuple(renderer.get_rendered_image()[32, 32]) == (0, 255, 0, 255)
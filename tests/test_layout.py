@@ -0,0 +1,25 @@
+import numpy as np
+
+import iceberg as ice
+
+
+def test_children_corners_match_child_bounds():
+    nodes = [
+        ice.Rectangle(ice.Bounds(size=(20 + i, 10)), border_color=ice.Colors.BLACK)
+        for i in range(6)
+    ]
+    arranged = ice.Arrange(
+        [
+            ice.Arrange(
+                nodes[:3], arrange_direction=ice.Arrange.Direction.VERTICAL, gap=5
+            ),
+            ice.Arrange(
+                nodes[3:], arrange_direction=ice.Arrange.Direction.VERTICAL, gap=7
+            ).scale(2),
+        ],
+        gap=30,
+    )
+
+    for corner in (ice.Corner.TOP_LEFT, ice.Corner.MIDDLE_RIGHT, ice.Corner.CENTER):
+        expected = [arranged.child_bounds(node).corners[corner] for node in nodes]
+        np.testing.assert_allclose(arranged.children_corners(nodes, corner), expected)
@@ -1,5 +1,10 @@
 import iceberg as ice
-from .scene_tester import check_render
+from .scene_tester import _compare_images, check_render
+
+import re
+
+import numpy as np
+from PIL import Image
 
 
 def test_dashed():
@@ -62,3 +67,136 @@ def test_partial():
     partial_line = ice.PartialPath(line, 0, 0.8)
     scene = blank.add_centered(partial_line)
     check_render(scene, "partial_path.png")
+
+
+def test_point_and_tangent_at():
+    line = ice.Line((10, 20), (110, 20), ice.PathStyle(ice.Colors.BLUE, thickness=5))
+    partial_line = ice.PartialPath(line, 0.2, 0.6)
+
+    for t, expected_x in [(0, 30), (0.5, 50), (1, 70)]:
+        point, tangent = partial_line.point_and_tangent_at(t)
+        np.testing.assert_allclose(point, (expected_x, 20), atol=1e-4)
+        np.testing.assert_allclose(tangent, (1, 0), atol=1e-4)
+
+
+def _render_image(drawable: ice.Drawable) -> Image.Image:
+    renderer = ice.Renderer()
+    renderer.render(drawable)
+    return Image.fromarray(renderer.get_rendered_image())
+
+
+def test_partial_line_matches_generic_path():
+    path_style = ice.PathStyle(ice.Colors.BLUE, thickness=5)
+    line = ice.Line((10, 20), (310, 420), path_style)
+
+    # The same geometry, but not a Line, so it is trimmed through the path measure.
+    generic_line = ice.Path.from_skia(line.skia_path, path_style)
+
+    for start, end in [(0, 1), (0.25, 0.75), (0, 0.5), (0.5, 1), (0.3, 0.3)]:
+        partial_line = ice.PartialPath(line, start, end, subdivide_increment=0.1)
+        partial_generic = ice.PartialPath(
+            generic_line, start, end, subdivide_increment=0.1
+        )
+
+        assert len(partial_line.points) == len(partial_generic.points)
+        np.testing.assert_allclose(
+            [tuple(point) for point in partial_line.points],
+            [tuple(point) for point in partial_generic.points],
+            atol=1e-3,
+        )
+        np.testing.assert_allclose(
+            [tuple(tangent) for tangent in partial_line.tangents],
+            [tuple(tangent) for tangent in partial_generic.tangents],
+            atol=1e-3,
+        )
+
+        blank = ice.Blank(ice.Bounds(size=(320, 440)), ice.Colors.WHITE)
+        _compare_images(
+            "partial_line_fast_path.png",
+            _render_image(ice.Compose([blank, partial_generic])),
+            _render_image(ice.Compose([blank, partial_line])),
+            pixel_tolerance=0.1,
+            fractional_mismatch_tolerance=0.01,
+        )
+
+
+def test_line_batch_matches_lines():
+    path_style = ice.PathStyle(ice.Colors.BLUE, thickness=5)
+    starts = np.array([(10, 10), (10, 100), (200, 50)])
+    ends = np.array([(150, 40), (150, 200), (300, 250)])
+
+    batch = ice.LineBatch(starts, ends, path_style)
+    lines = ice.Compose(
+        [
+            ice.Line(tuple(start), tuple(end), path_style)
+            for start, end in zip(starts.tolist(), ends.tolist())
+        ]
+    )
+
+    for side in ["left", "top", "right", "bottom"]:
+        assert abs(getattr(batch.bounds, side) - getattr(lines.bounds, side)) < 1e-3
+
+    blank = ice.Blank(ice.Bounds(size=(320, 270)), ice.Colors.WHITE)
+    _compare_images(
+        "line_batch.png",
+        _render_image(ice.Compose([blank, lines])),
+        _render_image(ice.Compose([blank, batch])),
+        pixel_tolerance=0.1,
+        fractional_mismatch_tolerance=0.01,
+    )
+
+
+def test_path_style_get_is_shared():
+    color = ice.Color.from_hex("#2c3134")
+
+    path_style = ice.PathStyle.get(color, 3)
+
+    assert path_style is ice.PathStyle.get(color, 3)
+    assert path_style is not ice.PathStyle.get(color, 3, dash_intervals=(5, 5))
+    assert path_style == ice.PathStyle(color, 3)
+    assert path_style != ice.PathStyle(color, 4)
+
+
+def test_svg_precision(tmp_path):
+    blank = ice.Blank(ice.Bounds(size=(200, 200)), ice.Colors.WHITE)
+    line = ice.CurvedCubicLine(
+        points=[(10.123456, 20.987654), (100.55555, 10.11111), (190.76543, 180.3333)],
+        path_style=ice.PathStyle(ice.Colors.BLUE, thickness=3),
+    )
+    scene = ice.Compose([blank, line])
+
+    full_filename = str(tmp_path / "full.svg")
+    rounded_filename = str(tmp_path / "rounded.svg")
+    ice.render_svg(scene, full_filename)
+    ice.render_svg(scene, rounded_filename, precision=2)
+
+    with open(full_filename) as f:
+        full_svg = f.read()
+    with open(rounded_filename) as f:
+        rounded_svg = f.read()
+
+    path_data_pattern = re.compile(r'\bd="([^"]*)"')
+    number_pattern = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+    full_path_data = path_data_pattern.findall(full_svg)
+    rounded_path_data = path_data_pattern.findall(rounded_svg)
+    assert len(full_path_data) == len(rounded_path_data) > 0
+
+    for full_d, rounded_d in zip(full_path_data, rounded_path_data):
+        full_numbers = [float(x) for x in number_pattern.findall(full_d)]
+        rounded_numbers = number_pattern.findall(rounded_d)
+        assert len(full_numbers) == len(rounded_numbers)
+
+        for number in rounded_numbers:
+            assert "." not in number or len(number.split(".")[1]) <= 2
+        np.testing.assert_allclose(
+            [float(x) for x in rounded_numbers], full_numbers, atol=0.005 + 1e-9
+        )
+
+    # Everything but the path data is unchanged. Skia numbers the clip paths of every
+    # document it writes differently, so their ids are left out of the comparison.
+    def _without_path_data(svg: str) -> str:
+        svg = path_data_pattern.sub('d=""', svg)
+        return re.sub(r"\bcl_\d+\b", "cl_N", svg)
+
+    assert _without_path_data(full_svg) == _without_path_data(rounded_svg)
@@ -0,0 +1,13 @@
+import copy
+import pickle
+
+import iceberg as ice
+
+
+def test_color_copies_after_to_skia():
+    color = ice.Color(0.1, 0.2, 0.3, 0.4)
+    color.to_skia()
+
+    for copied in [pickle.loads(pickle.dumps(color)), copy.deepcopy(color)]:
+        assert copied == color
+        assert copied.to_skia().toColor() == color.to_skia().toColor()